@@ -0,0 +1,72 @@
+# core/clipboard.py
+"""
+Writing to the system clipboard.
+Uses the native Windows clipboard API when pywin32 is installed and
+falls back to pyperclip (text) or wl-copy/xclip (PNG) on other platforms.
+"""
+
+import os
+import shutil
+import subprocess
+from typing import List, Optional
+
+import pyperclip
+
+# pywin32 is optional - only available on Windows
+try:
+    import win32clipboard
+    WIN32_AVAILABLE = True
+except ImportError:
+    WIN32_AVAILABLE = False
+
+
+def _set_text_win32(text: str):
+    """Set clipboard text with a single SetClipboardData call"""
+    win32clipboard.OpenClipboard()
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+    finally:
+        win32clipboard.CloseClipboard()
+
+
+# Backend is chosen once at import instead of on every copy
+set_text = _set_text_win32 if WIN32_AVAILABLE else pyperclip.copy
+
+PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+
+
+def _find_png_command() -> Optional[List[str]]:
+    """Find a command-line tool that takes image/png on stdin"""
+    if os.environ.get('WAYLAND_DISPLAY') and shutil.which('wl-copy'):
+        return ['wl-copy', '--type', 'image/png']
+    if shutil.which('xclip'):
+        return ['xclip', '-selection', 'clipboard', '-t', 'image/png', '-i']
+    return None
+
+
+_PNG_COMMAND = None if WIN32_AVAILABLE else _find_png_command()
+
+
+def set_image_png(data: bytes) -> bool:
+    """
+    Put encoded PNG bytes on the clipboard without decoding them.
+    
+    Returns:
+        False if no image clipboard backend is available
+    """
+    if WIN32_AVAILABLE:
+        png_format = win32clipboard.RegisterClipboardFormat('PNG')
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(png_format, data)
+        finally:
+            win32clipboard.CloseClipboard()
+        return True
+    
+    if _PNG_COMMAND:
+        subprocess.run(_PNG_COMMAND, input=data, check=True, timeout=5)
+        return True
+    
+    return False
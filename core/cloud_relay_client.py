@@ -15,13 +15,15 @@ from core.cloud_relay_crypto import CloudRelayCrypto
 class CloudRelayClient:
     """Client for connecting to cloud relay server"""
     
-    def __init__(self, on_clipboard_received: Optional[Callable] = None, on_devices_updated: Optional[Callable] = None):
+    def __init__(self, on_clipboard_received: Optional[Callable] = None, on_devices_updated: Optional[Callable] = None,
+                 on_connection_changed: Optional[Callable] = None):
         """
         Initialize cloud relay client
         
         Args:
             on_clipboard_received: Callback function when clipboard data is received
             on_devices_updated: Callback function when device list is updated
+            on_connection_changed: Callback function with the new state when the socket connects or drops
         """
         self.sio = socketio.AsyncClient(
             reconnection=True,
@@ -38,6 +40,7 @@ class CloudRelayClient:
         self.connected = False
         self.on_clipboard_received = on_clipboard_received
         self.on_devices_updated = on_devices_updated
+        self.on_connection_changed = on_connection_changed
         self.crypto = CloudRelayCrypto()
         self.encryption_enabled = True
         
@@ -52,6 +55,8 @@ class CloudRelayClient:
             """Handle successful connection"""
             self.connected = True
             logger.info(f"Connected to cloud relay: {self.server_url}")
+            if self.on_connection_changed:
+                self.on_connection_changed(True)
             
             # Register device if we have room_id
             if self.room_id:
@@ -68,6 +73,8 @@ class CloudRelayClient:
             """Handle disconnection"""
             self.connected = False
             logger.warning("Disconnected from cloud relay")
+            if self.on_connection_changed:
+                self.on_connection_changed(False)
         
         @self.sio.event
         async def connect_error(data):
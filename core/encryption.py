@@ -31,6 +31,7 @@ class HybridEncryption:
         self.public_key = None
         self.device_id = self._generate_device_id()
         self.peer_public_keys = {}  # Store multiple peer keys
+        self._shared_keys = {}  # ECDH+HKDF result per peer, derived once
         self._generate_keypair()
     
     def _generate_device_id(self) -> str:
@@ -60,11 +61,18 @@ class HybridEncryption:
         pem = base64.b64decode(public_key_b64)
         public_key = serialization.load_pem_public_key(pem, self.backend)
         self.peer_public_keys[peer_id] = public_key
+        self._shared_keys.pop(peer_id, None)
     
-    def encrypt_content(self, content: bytes, content_type: str = 'text') -> Dict:
+    def encrypt_content(self, content: bytes, content_type: str = 'text',
+                        binary: bool = False) -> Dict:
         """
         Encrypt content with metadata.
         Different from chat: includes content type, compression, etc.
+        
+        With binary=True the ciphertext, keys, tag and IV are left as raw
+        bytes (sent as Socket.IO binary attachments) instead of base64 text,
+        and 'format' is 'binary'. Only peers that advertised binary envelope
+        support can decrypt that form; builds before it expect base64.
         """
         # Generate ephemeral symmetric key
         symmetric_key = secrets.token_bytes(32)
@@ -81,43 +89,45 @@ class HybridEncryption:
         encryptor = cipher.encryptor()
         ciphertext = encryptor.update(compressed) + encryptor.finalize()
         
-        # Encrypt symmetric key for each peer
+        encode = self._raw if binary else self._b64encode
+        
+        # Body is encrypted once above; only the 32-byte key is wrapped per peer
         encrypted_keys = {}
-        for peer_id, peer_key in self.peer_public_keys.items():
-            shared_key = self._derive_shared_key(peer_key)
+        for peer_id in self.peer_public_keys:
+            shared_key = self._get_shared_key(peer_id)
             encrypted_key = self._encrypt_symmetric_key(symmetric_key, shared_key)
-            encrypted_keys[peer_id] = base64.b64encode(encrypted_key).decode()
+            encrypted_keys[peer_id] = encode(encrypted_key)
         
         return {
             'device_id': self.device_id,
             'content_type': content_type,
-            'encrypted_content': base64.b64encode(ciphertext).decode(),
+            'encrypted_content': encode(ciphertext),
             'encrypted_keys': encrypted_keys,
-            'tag': base64.b64encode(encryptor.tag).decode(),
-            'iv': base64.b64encode(cipher.mode.initialization_vector).decode(),
-            'compressed': compressed != content
+            'tag': encode(encryptor.tag),
+            'iv': encode(cipher.mode.initialization_vector),
+            'compressed': compressed != content,
+            'format': 'binary' if binary else 'base64'
         }
     
     def decrypt_content(self, encrypted_data: Dict) -> Tuple[bytes, str]:
-        """Decrypt received content"""
+        """Decrypt received content (binary or base64 envelope)"""
         # Get our encrypted key
-        encrypted_key = base64.b64decode(
+        encrypted_key = self._to_bytes(
             encrypted_data['encrypted_keys'][self.device_id]
         )
         
         # Derive shared key with sender
         sender_id = encrypted_data['device_id']
-        peer_key = self.peer_public_keys.get(sender_id)
-        if not peer_key:
+        if sender_id not in self.peer_public_keys:
             raise ValueError(f"No public key for device {sender_id}")
         
-        shared_key = self._derive_shared_key(peer_key)
+        shared_key = self._get_shared_key(sender_id)
         symmetric_key = self._decrypt_symmetric_key(encrypted_key, shared_key)
         
         # Decrypt content
-        iv = base64.b64decode(encrypted_data['iv'])
-        tag = base64.b64decode(encrypted_data['tag'])
-        ciphertext = base64.b64decode(encrypted_data['encrypted_content'])
+        iv = self._to_bytes(encrypted_data['iv'])
+        tag = self._to_bytes(encrypted_data['tag'])
+        ciphertext = self._to_bytes(encrypted_data['encrypted_content'])
         
         cipher = Cipher(
             algorithms.AES(symmetric_key),
@@ -133,6 +143,29 @@ class HybridEncryption:
         
         return content, encrypted_data['content_type']
     
+    @staticmethod
+    def _raw(data: bytes) -> bytes:
+        return data
+    
+    @staticmethod
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+    
+    @staticmethod
+    def _to_bytes(value) -> bytes:
+        """Accept raw bytes or base64 text for an envelope field"""
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+        return base64.b64decode(value)
+    
+    def _get_shared_key(self, peer_id: str) -> bytes:
+        """Get the cached shared key for a peer, deriving it on first use"""
+        shared_key = self._shared_keys.get(peer_id)
+        if shared_key is None:
+            shared_key = self._derive_shared_key(self.peer_public_keys[peer_id])
+            self._shared_keys[peer_id] = shared_key
+        return shared_key
+    
     def _derive_shared_key(self, peer_public_key) -> bytes:
         """Derive shared key using ECDH"""
         shared_key = self.private_key.exchange(
@@ -49,6 +49,22 @@ class ClipboardContent:
             'metadata': self.metadata
         }
 
+def calculate_checksum(content: Any) -> str:
+    """
+    SHA-256 hex checksum of clipboard content.
+    Shared with the sync engine so echo detection compares like with like.
+    """
+    if isinstance(content, str):
+        data = content.encode()
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        data = content  # hashed in place via the buffer protocol, no copy
+    elif isinstance(content, Image.Image):
+        data = content.tobytes()
+    else:
+        data = str(content).encode()
+    
+    return hashlib.sha256(data).hexdigest()
+
 class ClipboardMonitor:
     """
     Monitor clipboard for changes and categorize content.
@@ -352,16 +368,7 @@ class ClipboardMonitor:
     
     def _calculate_checksum(self, content: Any) -> str:
         """Calculate content checksum"""
-        if isinstance(content, str):
-            data = content.encode()
-        elif isinstance(content, bytes):
-            data = content
-        elif isinstance(content, Image.Image):
-            data = content.tobytes()
-        else:
-            data = str(content).encode()
-        
-        return hashlib.sha256(data).hexdigest()
+        return calculate_checksum(content)
     
     def _add_to_history(self, content: ClipboardContent):
         """Add content to history"""
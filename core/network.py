@@ -8,7 +8,7 @@ import socket
 import json
 import threading
 import time
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
@@ -26,7 +26,7 @@ class DeviceStatus(Enum):
     PAIRING = "pairing"
     PAIRED = "paired"
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Represents a network device"""
     device_id: str
@@ -247,6 +247,9 @@ class P2PCommunication:
         self.message_handlers = {}
         self.runner = None
         self.on_device_paired = None  # Callback when device pairs
+        # Peers that said during pairing they can decrypt binary envelopes;
+        # older builds don't send the flag and only understand base64
+        self.binary_peers: Set[str] = set()
         
         # Setup server handlers
         self._setup_server_handlers()
@@ -276,12 +279,14 @@ class P2PCommunication:
             
             # Store public key
             self.encryption.import_peer_key(device_id, public_key)
+            self._note_capabilities(device_id, data)
             
             # Send our public key
             await self.sio_server.emit('pair_response', {
                 'device_id': self.device_id,
                 'public_key': self.encryption.export_public_key(),
-                'accepted': True
+                'accepted': True,
+                'binary_envelopes': True
             }, room=sid)
             
             logger.info(f"Paired with device: {device_id}")
@@ -359,7 +364,8 @@ class P2PCommunication:
             # Send pairing request
             await client.emit('pair_request', {
                 'device_id': self.device_id,
-                'public_key': self.encryption.export_public_key()
+                'public_key': self.encryption.export_public_key(),
+                'binary_envelopes': True
             })
         
         @client.event
@@ -376,6 +382,7 @@ class P2PCommunication:
                     data['device_id'],
                     data['public_key']
                 )
+                self._note_capabilities(data['device_id'], data)
                 logger.info(f"Pairing accepted by {device.name}")
                 
                 # Notify that pairing succeeded
@@ -422,6 +429,17 @@ class P2PCommunication:
         await asyncio.gather(*tasks, return_exceptions=True)
         logger.info(f"Clipboard broadcasted to {len(self.sio_clients)} devices")
     
+    def _note_capabilities(self, device_id: str, data: Dict):
+        """Record whether a peer advertised binary envelope support while pairing"""
+        if data.get('binary_envelopes'):
+            self.binary_peers.add(device_id)
+        else:
+            self.binary_peers.discard(device_id)
+    
+    def supports_binary(self, peer_ids) -> bool:
+        """True if every given peer can decrypt binary envelopes"""
+        return all(peer_id in self.binary_peers for peer_id in peer_ids)
+    
     def register_handler(self, event: str, handler: Callable):
         """Register message handler"""
         self.message_handlers[event] = handler
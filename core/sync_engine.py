@@ -6,21 +6,35 @@ This is the brain of the application.
 
 import asyncio
 import threading
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Set
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import json
-import hashlib
 import base64
 
 from loguru import logger
-import pyperclip
 
+# orjson is optional - it returns bytes directly and is much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+from . import clipboard
 from .encryption import HybridEncryption
-from .monitor import ClipboardMonitor, ClipboardContent, ContentType
+from .monitor import ClipboardMonitor, ClipboardContent, ContentType, calculate_checksum
 from .network import NetworkDiscovery, P2PCommunication, Device, DeviceStatus
 
-@dataclass
+@dataclass(slots=True)
 class SyncSettings:
     """User preferences for syncing"""
     auto_sync: bool = True
@@ -29,14 +43,18 @@ class SyncSettings:
     sync_files: bool = True
     require_confirmation: bool = False
     max_size_mb: int = 10
-    excluded_apps: List[str] = None
-    trusted_networks: List[str] = None
-    
-    def __post_init__(self):
-        if self.excluded_apps is None:
-            self.excluded_apps = ['password_manager', 'banking_app']
-        if self.trusted_networks is None:
-            self.trusted_networks = []
+    excluded_apps: List[str] = field(
+        default_factory=lambda: ['password_manager', 'banking_app']
+    )
+    trusted_networks: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class CloudRelayItem:
+    """Clipboard item received from the cloud relay, as handed to the GUI"""
+    content: str
+    content_type: str
+    device: str
+    timestamp: datetime
 
 class SyncEngine:
     """
@@ -44,6 +62,9 @@ class SyncEngine:
     Much more sophisticated than simple chat message passing.
     """
     
+    # Burst of local changes within this window is sent as one broadcast
+    BROADCAST_BATCH_WINDOW = 0.01
+    
     def __init__(self, device_name: str = None):
         # Core components
         self.encryption = HybridEncryption()
@@ -70,6 +91,13 @@ class SyncEngine:
         self.sync_history: List[Dict] = []
         self.incoming_clipboard = None  # Prevent echo
         
+        # Optional listeners, called from engine threads
+        self.on_clipboard_captured: Optional[Callable[[ClipboardContent], None]] = None
+        self.on_cloud_item_received: Optional[Callable[[CloudRelayItem], None]] = None
+        self.on_devices_changed: Optional[Callable[[], None]] = None
+        self.on_cloud_relay_changed: Optional[Callable[[], None]] = None
+        self.cloud_devices: List[Dict] = []  # Latest device list from the cloud relay room
+        
         # Setup callbacks
         self.discovery.on_device_discovered = self._on_device_discovered
         self.discovery.on_device_lost = self._on_device_lost
@@ -79,6 +107,13 @@ class SyncEngine:
         # Async event loop for P2P
         self.loop = None
         self.loop_thread = None
+        self._shutdown_event: Optional[asyncio.Event] = None
+        
+        # Outgoing P2P broadcast coalescing
+        self._pending_broadcast: Optional[Dict] = None
+        self._broadcast_scheduled = False
+        self._broadcast_lock = threading.Lock()
+        self._broadcast_tasks: Set[asyncio.Task] = set()  # Strong refs until each send finishes
     
     def start(self):
         """Start the sync engine"""
@@ -91,6 +126,7 @@ class SyncEngine:
         # Create new event loop if previous one was stopped
         if self.loop is None or self.loop.is_closed():
             self.loop = asyncio.new_event_loop()
+            self._shutdown_event = asyncio.Event()
             self.loop_thread = threading.Thread(
                 target=self._run_async_loop,
                 daemon=True
@@ -101,12 +137,6 @@ class SyncEngine:
         self.monitor.start_monitoring()
         self.discovery.start_discovery()
         
-        # Start P2P server
-        asyncio.run_coroutine_threadsafe(
-            self.p2p.start_server(self.discovery.local_ip, self.discovery.port),
-            self.loop
-        )
-        
         logger.info(f"Sync engine started - Device: {self.device_name}")
     
     def stop(self):
@@ -119,19 +149,12 @@ class SyncEngine:
         # Stop components first
         self.monitor.stop_monitoring()
         
-        # Stop P2P server with proper async handling
+        # Wake the loop once; it stops the P2P server and exits on its own
         if self.loop and not self.loop.is_closed():
             try:
-                # Create stop coroutine
-                stop_coro = self.p2p.stop_server()
-                # Run it in the event loop
-                future = asyncio.run_coroutine_threadsafe(stop_coro, self.loop)
-                # Wait for it to complete
-                future.result(timeout=3)
-            except asyncio.TimeoutError:
-                logger.warning("P2P server stop timed out")
-            except Exception as e:
-                logger.warning(f"Error stopping P2P server: {e}")
+                self.loop.call_soon_threadsafe(self._shutdown_event.set)
+            except RuntimeError as e:
+                logger.warning(f"Error signalling event loop shutdown: {e}")
         
         # Stop discovery (this recreates zeroconf for next start)
         try:
@@ -139,26 +162,6 @@ class SyncEngine:
         except Exception as e:
             logger.warning(f"Error stopping discovery: {e}")
         
-        # Stop event loop gracefully
-        if self.loop and not self.loop.is_closed():
-            try:
-                # Cancel all pending tasks
-                try:
-                    # Get all tasks for this loop
-                    all_tasks = [task for task in asyncio.all_tasks(self.loop) 
-                                if not task.done()]
-                    
-                    # Cancel each one
-                    for task in all_tasks:
-                        self.loop.call_soon_threadsafe(task.cancel)
-                except Exception as e:
-                    logger.debug(f"Could not cancel tasks: {e}")
-                
-                # Stop the loop
-                self.loop.call_soon_threadsafe(self.loop.stop)
-            except Exception as e:
-                logger.warning(f"Error stopping event loop: {e}")
-        
         # Wait for thread to finish BEFORE closing loop
         if self.loop_thread and self.loop_thread.is_alive():
             self.loop_thread.join(timeout=5)
@@ -166,7 +169,7 @@ class SyncEngine:
                 logger.warning("Event loop thread did not stop in time")
         
         # Now close the event loop
-        if self.loop and not self.loop.is_closed():
+        if self.loop and not self.loop.is_closed() and not self.loop.is_running():
             try:
                 self.loop.close()
             except Exception as e:
@@ -175,16 +178,44 @@ class SyncEngine:
         # Set to None so start() creates a new one
         self.loop = None
         self.loop_thread = None
+        self._shutdown_event = None
+        with self._broadcast_lock:
+            self._pending_broadcast = None
+            self._broadcast_scheduled = False
         
         logger.info("Sync engine stopped")
     
     def _run_async_loop(self):
-        """Run async event loop in thread"""
+        """Run async event loop in thread until shutdown is signalled"""
         asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+        self.loop.run_until_complete(self._serve_until_shutdown())
+    
+    async def _serve_until_shutdown(self):
+        """Run the P2P server until stop() sets the shutdown event"""
+        try:
+            await self.p2p.start_server(self.discovery.local_ip, self.discovery.port)
+        except Exception as e:
+            logger.error(f"Failed to start P2P server: {e}")
+        
+        await self._shutdown_event.wait()
+        
+        try:
+            await self.p2p.stop_server()
+        except Exception as e:
+            logger.warning(f"Error stopping P2P server: {e}")
+        
+        # Cancel whatever is still scheduled (sends, pairing attempts) in-loop
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
     
     def _on_clipboard_change(self, clipboard_data: ClipboardContent):
         """Handle local clipboard change"""
+        if self.on_clipboard_captured:
+            self.on_clipboard_captured(clipboard_data)
+        
         # Don't sync if it came from another device (local or cloud)
         if self.incoming_clipboard:
             # Check if it's the same content
@@ -210,20 +241,20 @@ class SyncEngine:
         
         # Encrypt for all paired devices (local P2P)
         if self.paired_devices:
+            # Raw bytes travel as Socket.IO binary attachments, no base64, but only
+            # when every recipient negotiated it; older peers still get base64
             encrypted_data = self.encryption.encrypt_content(
                 content_bytes,
-                clipboard_data.content_type.value
+                clipboard_data.content_type.value,
+                binary=self.p2p.supports_binary(self.encryption.peer_public_keys)
             )
             
             # Add metadata
             encrypted_data['metadata'] = clipboard_data.metadata
             encrypted_data['timestamp'] = clipboard_data.timestamp.isoformat()
             
-            # Broadcast to all devices
-            asyncio.run_coroutine_threadsafe(
-                self.p2p.broadcast_clipboard(encrypted_data),
-                self.loop
-            )
+            # Broadcast to all devices (coalesced with any burst in flight)
+            self._queue_broadcast(encrypted_data)
             
             logger.info(f"Clipboard synced to {len(self.paired_devices)} devices")
         
@@ -242,9 +273,46 @@ class SyncEngine:
                     self.loop
                 )
     
+    def _queue_broadcast(self, encrypted_data: Dict):
+        """Queue an envelope for broadcast, flushed after BROADCAST_BATCH_WINDOW"""
+        with self._broadcast_lock:
+            # Clipboard holds one value, so a newer envelope supersedes older ones
+            self._pending_broadcast = encrypted_data
+            if self._broadcast_scheduled:
+                return
+            self._broadcast_scheduled = True
+        
+        self.loop.call_soon_threadsafe(
+            self.loop.call_later, self.BROADCAST_BATCH_WINDOW, self._flush_broadcast
+        )
+    
+    def _flush_broadcast(self):
+        """Send the newest queued envelope (runs on the event loop)"""
+        with self._broadcast_lock:
+            encrypted_data = self._pending_broadcast
+            self._pending_broadcast = None
+            self._broadcast_scheduled = False
+        
+        if encrypted_data is not None:
+            task = self.loop.create_task(self.p2p.broadcast_clipboard(encrypted_data))
+            self._broadcast_tasks.add(task)
+            task.add_done_callback(self._on_broadcast_done)
+    
+    def _on_broadcast_done(self, task: asyncio.Task):
+        """Release a finished broadcast task and log its failure, if any"""
+        self._broadcast_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error broadcasting clipboard: {task.exception()}")
+    
+    def _notify_devices_changed(self):
+        """Tell the listener that discovered or paired devices changed"""
+        if self.on_devices_changed:
+            self.on_devices_changed()
+    
     def _on_device_discovered(self, device: Device):
         """Handle new device discovery"""
         logger.info(f"Device discovered: {device.name}")
+        self._notify_devices_changed()
         
         # Auto-pair if trusted network
         if self.settings.trusted_networks:
@@ -257,6 +325,7 @@ class SyncEngine:
         if device.device_id in self.paired_devices:
             del self.paired_devices[device.device_id]
             logger.info(f"Device disconnected: {device.name}")
+        self._notify_devices_changed()
     
     def _pair_with_device(self, device: Device):
         """Pair with a discovered device"""
@@ -278,6 +347,7 @@ class SyncEngine:
             device.status = DeviceStatus.PAIRED
             self.paired_devices[device_id] = device
             logger.info(f"Device paired: {device.name}")
+            self._notify_devices_changed()
     
     async def _handle_incoming_clipboard(self, content: bytes, content_type: str, 
                                         device_id: str):
@@ -287,14 +357,13 @@ class SyncEngine:
             clipboard_content = self._bytes_to_content(content, content_type)
             
             # Set flag to prevent echo
-            self.incoming_clipboard = hashlib.sha256(content).hexdigest()
+            self.incoming_clipboard = calculate_checksum(content)
             
-            # Update local clipboard
+            # Update local clipboard (blocking call, keep it off the loop)
             if content_type == ContentType.TEXT.value:
-                pyperclip.copy(clipboard_content)
+                await asyncio.to_thread(clipboard.set_text, clipboard_content)
             elif content_type == ContentType.IMAGE.value:
-                # Handle image (platform specific)
-                self._set_image_clipboard(clipboard_content)
+                await asyncio.to_thread(self._set_image_clipboard, clipboard_content)
             
             # Add to history
             device = self.paired_devices.get(device_id)
@@ -348,10 +417,10 @@ class SyncEngine:
             return content
         else:
             # Serialize complex types
-            return json.dumps({
+            return _json_dumps({
                 'content': str(content),
                 'type': clipboard_data.content_type.value
-            }).encode('utf-8')
+            })
     
     def _bytes_to_content(self, data: bytes, content_type: str):
         """Convert bytes back to appropriate content type"""
@@ -360,40 +429,54 @@ class SyncEngine:
         elif content_type == ContentType.IMAGE.value:
             return data  # Return as bytes for image processing
         elif content_type == ContentType.JSON.value:
-            return json.loads(data.decode('utf-8'))
+            return _json_loads(data)
         else:
             try:
                 # Try to deserialize
-                obj = json.loads(data.decode('utf-8'))
+                obj = _json_loads(data)
                 return obj.get('content', data.decode('utf-8'))
             except:
                 return data.decode('utf-8', errors='ignore')
     
     def _set_image_clipboard(self, image_data: bytes):
-        """Set image to clipboard (platform specific)"""
+        """Set image to clipboard, passing PNG bytes through undecoded"""
         try:
-            from PIL import Image
-            import io
-            
-            # Convert bytes to PIL Image
-            image = Image.open(io.BytesIO(image_data))
+            if not image_data.startswith(clipboard.PNG_MAGIC):
+                # Unusual format - re-encode to PNG once
+                from PIL import Image
+                import io
+                
+                output = io.BytesIO()
+                Image.open(io.BytesIO(image_data)).save(output, format='PNG')
+                image_data = output.getvalue()
             
-            # Platform specific clipboard handling
-            # This is simplified - real implementation would use platform APIs
-            logger.info("Image clipboard set (platform specific implementation needed)")
+            if clipboard.set_image_png(image_data):
+                logger.info("Image clipboard set")
+            else:
+                logger.warning("No image clipboard backend available on this platform")
             
         except Exception as e:
             logger.error(f"Error setting image clipboard: {e}")
     
     def _add_to_history(self, action: str, data: any):
         """Add sync event to history"""
-        history_entry = {
-            'action': action,
-            'timestamp': datetime.now().isoformat(),
-            'data': data if isinstance(data, dict) else {
+        if isinstance(data, ClipboardContent):
+            entry_data = {
+                'content_type': data.content_type.value,
+                'device': data.device_id
+            }
+        elif isinstance(data, dict):
+            entry_data = data
+        else:
+            entry_data = {
                 'content_type': getattr(data, 'content_type', 'unknown'),
                 'device': getattr(data, 'device_id', 'unknown')
             }
+        
+        history_entry = {
+            'action': action,
+            'timestamp': datetime.now().isoformat(),
+            'data': entry_data
         }
         
         self.sync_history.append(history_entry)
@@ -424,7 +507,7 @@ class SyncEngine:
     def pair_with_qr_code(self, qr_data: str) -> bool:
         """Pair with device using QR code data"""
         try:
-            data = json.loads(qr_data)
+            data = _json_loads(qr_data)
             device = Device(
                 device_id=data['device_id'],
                 name=data['device_name'],
@@ -455,7 +538,7 @@ class SyncEngine:
             'public_key': self.encryption.export_public_key(),
             'timestamp': datetime.now().isoformat()
         }
-        return json.dumps(qr_data)
+        return _json_dumps(qr_data).decode('utf-8')
     
     # ==================== Cloud Relay Methods ====================
     
@@ -480,7 +563,8 @@ class SyncEngine:
             if self.cloud_relay is None:
                 self.cloud_relay = CloudRelayClient(
                     on_clipboard_received=self._on_cloud_clipboard_received,
-                    on_devices_updated=self._on_devices_updated
+                    on_devices_updated=self._on_devices_updated,
+                    on_connection_changed=self._on_cloud_connection_changed
                 )
             
             # Get device name from parameter or system
@@ -497,6 +581,7 @@ class SyncEngine:
             if success:
                 self.cloud_relay_enabled = True
                 logger.info(f"Connected to cloud relay: {server_url} in room {room_id}")
+                self._notify_cloud_relay_changed()
             else:
                 logger.error("Failed to connect to cloud relay")
             
@@ -512,15 +597,29 @@ class SyncEngine:
             if self.cloud_relay:
                 await self.cloud_relay.disconnect_from_server()
                 self.cloud_relay_enabled = False
+                self.cloud_devices = []
                 logger.info("Disconnected from cloud relay")
+                self._notify_cloud_relay_changed()
         except Exception as e:
             logger.error(f"Error disconnecting from cloud relay: {e}")
     
+    def _notify_cloud_relay_changed(self):
+        """Tell the listener that cloud relay state or its device list changed"""
+        if self.on_cloud_relay_changed:
+            self.on_cloud_relay_changed()
+    
+    def _on_cloud_connection_changed(self, connected: bool):
+        """Handle the cloud relay socket connecting or dropping"""
+        if not connected:
+            self.cloud_devices = []
+        self._notify_cloud_relay_changed()
+    
     def _on_devices_updated(self, devices: list):
         """Handle device list update from cloud relay"""
         try:
             logger.info(f"Device list updated: {len(devices)} devices")
-            # TODO: Update GUI with device list
+            self.cloud_devices = list(devices)
+            self._notify_cloud_relay_changed()
         except Exception as e:
             logger.error(f"Error handling devices update: {e}")
     
@@ -530,20 +629,24 @@ class SyncEngine:
             logger.info(f"Received clipboard from cloud relay: {data_type}")
             
             # Set incoming clipboard checksum to prevent echo (consistent with P2P)
-            import hashlib
-            self.incoming_clipboard = hashlib.sha256(content.encode() if isinstance(content, str) else content).hexdigest()
+            self.incoming_clipboard = calculate_checksum(content)
             
-            # Add to sync history for GUI notification
+            # Add to sync history and notify the GUI with a typed item
+            preview = content[:100] if isinstance(content, str) else '[binary data]'
             self._add_to_history('received', {
-                'content': content[:100] if isinstance(content, str) else '[binary data]',
+                'content': preview,
                 'content_type': data_type,
                 'device': 'Cloud Relay',
                 'source': 'cloud_relay'
             })
+            if self.on_cloud_item_received:
+                self.on_cloud_item_received(
+                    CloudRelayItem(preview, data_type, 'Cloud Relay', datetime.now())
+                )
             
             # Update local clipboard
             if data_type == 'text':
-                pyperclip.copy(content)
+                clipboard.set_text(content)
                 logger.info("✅ Text clipboard updated from cloud relay")
             elif data_type == 'image':
                 # Handle image data
@@ -579,7 +682,6 @@ class SyncEngine:
                     # Fallback: save to file
                     import tempfile
                     import os
-                    from datetime import datetime
                     
                     if content.startswith('data:image'):
                         content = content.split(',')[1]
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+# gui/history.py
+"""
+Clipboard history model, delegate and search index for the GUI.
+Rows are plain dicts painted by a delegate instead of one widget per item,
+and an incremental trigram index keeps filtering from rescanning every row.
+"""
+
+import re
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QEvent, QMimeData, QModelIndex, QRect, QSize, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate
+
+from gui.styles import Colors, CONTENT_ICONS
+
+# Filter combo entries mapped to the kind stored in the index
+FILTER_KINDS = {
+    'text': 'text',
+    'images': 'image',
+    'urls': 'url',
+    'code': 'code'
+}
+
+CODE_KEYWORDS = ('def ', 'class ', 'import ', 'function')
+_CODE_RE = re.compile('|'.join(map(re.escape, CODE_KEYWORDS)), re.IGNORECASE)
+
+# Only the start of an item is inspected when classifying it
+CLASSIFY_SCAN_CHARS = 4096
+
+# Custom data roles exposed by HistoryModel
+CONTENT_ROLE = Qt.ItemDataRole.UserRole
+TYPE_ROLE = Qt.ItemDataRole.UserRole + 1
+TIMESTAMP_ROLE = Qt.ItemDataRole.UserRole + 2
+DEVICE_ROLE = Qt.ItemDataRole.UserRole + 3
+ID_ROLE = Qt.ItemDataRole.UserRole + 4
+META_ROLE = Qt.ItemDataRole.UserRole + 5
+DATA_ROLE = Qt.ItemDataRole.UserRole + 6
+
+# Rows kept in the history tab
+MAX_HISTORY_ROWS = 100
+
+# Text beyond this is not split into trigrams; longer items are
+# always verified by substring match instead
+MAX_INDEXED_CHARS = 10_000
+
+
+def classify_content(content: str) -> str:
+    """Classify history content as url, code or text for filtering"""
+    if content.startswith(('http://', 'https://')):
+        return 'url'
+    if _CODE_RE.search(content, 0, CLASSIFY_SCAN_CHARS):
+        return 'code'
+    return 'text'
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class HistorySearchIndex:
+    """
+    Inverted index from lowercase trigrams to history item ids.
+    
+    A query is answered by intersecting the posting sets of its trigrams
+    and verifying the few remaining candidates with a substring check.
+    """
+    
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._texts: Dict[int, str] = {}
+        self._kinds: Dict[str, Set[int]] = defaultdict(set)
+        self._unindexed: Set[int] = set()  # Too long to split into trigrams
+    
+    def __len__(self) -> int:
+        return len(self._texts)
+    
+    def add(self, item_id: int, text: str, kind: str):
+        """Index an item's searchable text under its kind"""
+        text = text.lower()
+        self._texts[item_id] = text
+        self._kinds[kind].add(item_id)
+        
+        if len(text) > MAX_INDEXED_CHARS:
+            self._unindexed.add(item_id)
+            return
+        
+        for gram in _trigrams(text):
+            self._postings[gram].add(item_id)
+    
+    def remove(self, item_id: int):
+        """Drop an item from the index"""
+        text = self._texts.pop(item_id, None)
+        if text is None:
+            return
+        
+        for ids in self._kinds.values():
+            ids.discard(item_id)
+        
+        if item_id in self._unindexed:
+            self._unindexed.discard(item_id)
+            return
+        
+        for gram in _trigrams(text):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._postings[gram]
+    
+    def matches(self, item_id: int, query: str, kind: Optional[str] = None) -> bool:
+        """Check a single item against a query without a full search"""
+        if kind and item_id not in self._kinds.get(kind, ()):
+            return False
+        return query.lower() in self._texts[item_id]
+    
+    def clear(self):
+        """Remove every item"""
+        self._postings.clear()
+        self._texts.clear()
+        self._kinds.clear()
+        self._unindexed.clear()
+    
+    def search(self, query: str, kind: Optional[str] = None) -> Set[int]:
+        """
+        Get ids of items containing query (case-insensitive).
+        
+        Args:
+            query: Substring to look for, empty matches everything
+            kind: Only return items of this kind
+        """
+        scope = self._kinds.get(kind, set()) if kind else self._texts.keys()
+        query = query.lower()
+        if not query:
+            return set(scope)
+        
+        if len(query) < 3:
+            candidates = scope
+        else:
+            postings = []
+            for gram in _trigrams(query):
+                ids = self._postings.get(gram)
+                if not ids:
+                    postings = None
+                    break
+                postings.append(ids)
+            
+            if postings:
+                postings.sort(key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+            else:
+                candidates = set()
+            candidates |= self._unindexed
+            if kind:
+                candidates &= scope
+        
+        texts = self._texts
+        return {item_id for item_id in candidates if query in texts[item_id]}
+
+
+def make_history_row(item_id: int, content: str, content_type: str, timestamp: datetime,
+                     device: str, is_sent: bool, hhmmss: Optional[str] = None,
+                     data: Optional[bytes] = None) -> Dict:
+    """
+    Build a history row with its display strings computed once.
+    
+    Pass hhmmss when the caller already formatted the timestamp, and data
+    with the original bytes of binary items, whose content is only a
+    description.
+    """
+    preview = content[:100] + '...' if len(content) > 100 else content
+    direction = 'Sent to' if is_sent else 'From'
+    if hhmmss is None:
+        hhmmss = timestamp.strftime('%H:%M:%S')
+    return {
+        'id': item_id,
+        'content': content,
+        'type': content_type,
+        'timestamp': timestamp,
+        'device': device,
+        'preview': preview.replace('\n', ' '),
+        'hhmmss': hhmmss,
+        'meta': f"{direction} {device} • {hhmmss}",
+        'data': data
+    }
+
+
+def history_mime_data(content: str, data: Optional[bytes] = None) -> QMimeData:
+    """Build the clipboard payload for a history row: the original bytes if it has any, else its text"""
+    mime = QMimeData()
+    if data is None:
+        mime.setText(content)
+        return mime
+    
+    image = QImage.fromData(bytes(data))
+    if not image.isNull():
+        mime.setImageData(image)
+    else:
+        mime.setData('application/octet-stream', bytes(data))
+    return mime
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    List model of history rows, newest first.
+    
+    Rows are only ever added at the top and dropped from the bottom, so
+    ids stay contiguous and a row is found from its id by subtraction.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row['preview']
+        if role == CONTENT_ROLE:
+            return row['content']
+        if role == TYPE_ROLE:
+            return row['type']
+        if role == TIMESTAMP_ROLE:
+            return row['timestamp']
+        if role == DEVICE_ROLE:
+            return row['device']
+        if role == ID_ROLE:
+            return row['id']
+        if role == META_ROLE:
+            return row['meta']
+        if role == DATA_ROLE:
+            return row['data']
+        return None
+    
+    def prepend(self, row: Dict):
+        """Insert a row at the top"""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, row)
+        self.endInsertRows()
+    
+    def remove_oldest(self, count: int) -> List[Dict]:
+        """Remove up to count rows from the bottom and return them"""
+        count = min(count, len(self._rows))
+        if count <= 0:
+            return []
+        
+        first = len(self._rows) - count
+        self.beginRemoveRows(QModelIndex(), first, len(self._rows) - 1)
+        removed = self._rows[first:]
+        del self._rows[first:]
+        self.endRemoveRows()
+        return removed
+    
+    def clear(self):
+        """Remove every row"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+    
+    def row_for_id(self, item_id: int) -> int:
+        """Get the row of an item id, or -1 if it is no longer in the model"""
+        if not self._rows:
+            return -1
+        row = self._rows[0]['id'] - item_id
+        return row if 0 <= row < len(self._rows) else -1
+
+
+class HistoryDelegate(QStyledItemDelegate):
+    """Paints a history row (icon, preview, metadata and Copy button)"""
+    
+    ROW_HEIGHT = 64
+    
+    copy_requested = pyqtSignal(QModelIndex)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon_font = QFont()
+        self._icon_font.setPixelSize(24)
+        self._text_font = QFont()
+        self._text_font.setPixelSize(12)
+        self._meta_font = QFont()
+        self._meta_font.setPixelSize(10)
+        self._button_font = QFont()
+        self._button_font.setBold(True)
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    @staticmethod
+    def _card_rect(rect: QRect) -> QRect:
+        return rect.adjusted(4, 3, -4, -3)
+    
+    @classmethod
+    def _button_rect(cls, rect: QRect) -> QRect:
+        card = cls._card_rect(rect)
+        return QRect(card.right() - 70, card.center().y() - 15, 60, 30)
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        card = self._card_rect(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(QPen(QColor(Colors.PRIMARY if hovered else Colors.BORDER)))
+        painter.setBrush(QColor(Colors.BACKGROUND_LIGHT if hovered else Colors.CARD))
+        painter.drawRoundedRect(card, 8, 8)
+        
+        # Icon based on content type
+        content_type = index.data(TYPE_ROLE)
+        painter.setFont(self._icon_font)
+        painter.setPen(QColor(Colors.TEXT))
+        painter.drawText(QRect(card.left() + 10, card.top(), 40, card.height()),
+                         Qt.AlignmentFlag.AlignCenter,
+                         CONTENT_ICONS.get(content_type, CONTENT_ICONS['default']))
+        
+        # Preview and metadata
+        button = self._button_rect(option.rect)
+        text_left = card.left() + 60
+        text_width = button.left() - 10 - text_left
+        painter.setFont(self._text_font)
+        preview = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole), Qt.TextElideMode.ElideRight, text_width
+        )
+        painter.drawText(QRect(text_left, card.top() + 8, text_width, 24),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, preview)
+        
+        painter.setFont(self._meta_font)
+        painter.setPen(QColor(Colors.TEXT_MUTED))
+        painter.drawText(QRect(text_left, card.top() + 32, text_width, 18),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         index.data(META_ROLE))
+        
+        # Copy button
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(Colors.PRIMARY_DARK if hovered else Colors.PRIMARY))
+        painter.drawRoundedRect(button, 4, 4)
+        painter.setFont(self._button_font)
+        painter.setPen(QColor('white'))
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "Copy")
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.copy_requested.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -4,32 +4,40 @@
 Clipboard Sync Tool GUI using PyQt6.
 """
 
-import sys
 import os
-import base64
-import io
+import sys
+import hashlib
 import asyncio
+import json
+import threading
+import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from PyQt6.QtWidgets import *
-from PyQt6.QtCore import *
-from PyQt6.QtGui import *
-from PyQt6.QtMultimedia import QSoundEffect
-import qrcode
-import pyperclip
+from loguru import logger
+from PyQt6.QtWidgets import (
+    QAbstractItemView, QApplication, QCheckBox, QComboBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit, QListView, QMainWindow, QMenu,
+    QMessageBox, QProgressDialog, QPushButton, QSpinBox, QSystemTrayIcon,
+    QTabWidget, QTextEdit, QToolTip, QVBoxLayout, QWidget
+)
+from PyQt6.QtCore import Qt, QModelIndex, QStringListModel, QTimer, QUrl
+from PyQt6.QtGui import QColor, QCursor, QIcon, QImage, QPixmap
 
 # Import centralized styles and widgets
 from gui import styles
-from gui.styles import Colors, CONTENT_ICONS, PLATFORM_ICONS
-from gui.widgets import ClipboardItemWidget, DeviceWidget, StatCard
+from gui.widgets import DeviceWidget
+from gui.signals import EngineSignals, run_in_thread_pool, run_on_engine_loop
+from gui.history import (
+    CONTENT_ROLE, DATA_ROLE, FILTER_KINDS, MAX_HISTORY_ROWS, HistoryDelegate, HistoryModel,
+    HistorySearchIndex, classify_content, history_mime_data, make_history_row
+)
 
 try:
     from core.sync_engine import SyncEngine
-    from core.monitor import ContentType
     from gui.pairing_server import PairingServer
     CORE_AVAILABLE = True
 except ImportError:
@@ -37,42 +45,81 @@ except ImportError:
     PairingServer = None
     print("Warning: Core modules not available, running in limited mode")
 
+# Written by the cloud relay deploy scripts
+CLOUD_RELAY_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cloud-relay-config.json'
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Entries shown in the dashboard's Recent Activity list
+    MAX_ACTIVITY_ITEMS = 10
+    # Checksums of captured items remembered for de-duplication; older ones fall off
+    MAX_SEEN_CHECKSUMS = 500
+    # Quiet period before the history filter runs after typing
+    FILTER_DEBOUNCE_MS = 120
+    # How long quitting waits for the pairing server and sync engine to stop
+    SHUTDOWN_TIMEOUT_S = 5.0
+    # Extra time a stuck stop gets after the event loop quits before the process is ended
+    SHUTDOWN_GRACE_S = 2.0
+    
     def __init__(self):
         super().__init__()
         self.sync_engine = None
         self.pairing_server = None
-        self.clipboard_history = []
-        self.history_widgets = []
+        self._seen_checksums = OrderedDict()  # LRU of recent item checksums
+        self._total_syncs = 0
+        self._history_index = HistorySearchIndex()
+        self._history_visible = set()
+        self._next_history_id = 0
+        self._activity = deque(maxlen=self.MAX_ACTIVITY_ITEMS)
+        self._dashboard_flush_pending = False
+        self._paired_widgets = {}
+        self._discovered_widgets = {}
+        self._cloud_devices_key = None  # Device list last rendered in the cloud card
+        self._devices_dirty = False  # Device lists changed while the Devices tab was off screen
+        self._qr_dialog = None  # Dialogs are built on first open and reused
+        self._qr_generation = 0
+        self._pairing_key = None  # (device id, name, ip, port) the cached QR was made for
+        self._pairing_data = None
+        self._pairing_pixmap = None
+        self._cloud_dialog = None
+        self._quit_box = None
+        self._quitting = False
+        self._shutdown_done = False
+        self._reported_errors = set()  # Errors already printed by _report_error
         self.is_syncing = True
+        
+        # Coalesce search keystrokes into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self.sound_enabled = True
         
         # Setup sound effect
         self.setup_sound()
         
         self.setup_ui()
+        
+        # Quits that bypass quit_application (session logout, app.exit() elsewhere)
+        # still stop the backends
+        QApplication.instance().aboutToQuit.connect(self._stop_backends)
+        
         if CORE_AVAILABLE:
             self.setup_sync_engine()
         else:
             self.setup_simple_mode()
-        self.setup_timers()
     
     def setup_sound(self):
-        """Setup notification sound"""
-        self.notification_sound = QSoundEffect()
+        """Setup notification sound (QtMultimedia is loaded on first play)"""
+        self.notification_sound = None
         
         # Try to load custom sound, fall back to system beep
-        sound_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'notification.wav')
-        if os.path.exists(sound_path):
-            self.notification_sound.setSource(QUrl.fromLocalFile(sound_path))
-        else:
-            # Create a simple beep sound path (will use system sound as fallback)
-            self._use_system_beep = True
-        
-        self.notification_sound.setVolume(0.5)
+        self._sound_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'notification.wav')
+        self._use_system_beep = not os.path.exists(self._sound_path)
     
     def play_notification_sound(self):
         """Play notification sound when clipboard is received"""
@@ -80,10 +127,16 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            if hasattr(self, '_use_system_beep') and self._use_system_beep:
+            if self._use_system_beep:
                 # Use system beep
                 QApplication.beep()
             else:
+                if self.notification_sound is None:
+                    from PyQt6.QtMultimedia import QSoundEffect
+                    
+                    self.notification_sound = QSoundEffect(self)
+                    self.notification_sound.setSource(QUrl.fromLocalFile(self._sound_path))
+                    self.notification_sound.setVolume(0.5)
                 self.notification_sound.play()
         except Exception as e:
             print(f"Could not play sound: {e}")
@@ -95,6 +148,7 @@ class MainWindow(QMainWindow):
         
         # Set modern style from centralized styles
         self.setStyleSheet(styles.MAIN_WINDOW)
+        QApplication.instance().setStyleSheet(styles.APP_QSS)
         
         # Central widget
         central_widget = QWidget()
@@ -126,6 +180,7 @@ class MainWindow(QMainWindow):
         # Settings tab
         self.settings_tab = self.create_settings_tab()
         self.tabs.addTab(self.settings_tab, "⚙️ Settings")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         main_layout.addWidget(self.tabs)
         
@@ -145,12 +200,12 @@ class MainWindow(QMainWindow):
         
         # Status
         self.status_label = QLabel("🟢 Sync Active")
-        self.status_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.status_label.setObjectName("HeaderStatus")
         layout.addWidget(self.status_label)
         
         # Device count
         self.device_count_label = QLabel("0 devices connected")
-        self.device_count_label.setStyleSheet("font-size: 14px;")
+        self.device_count_label.setObjectName("HeaderDeviceCount")
         layout.addWidget(self.device_count_label)
         
         layout.addStretch()
@@ -194,30 +249,16 @@ class MainWindow(QMainWindow):
         
         # Recent activity
         activity_group = QGroupBox("Recent Activity")
-        activity_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px;
-            }
-        """)
+        activity_group.setObjectName("RecentActivity")
         activity_layout = QVBoxLayout()
         
-        self.activity_list = QListWidget()
-        self.activity_list.setStyleSheet("""
-            QListWidget {
-                border: none;
-                background-color: #f9f9f9;
-            }
-        """)
+        # Backed by a small string model refreshed once per burst of events
+        self.activity_model = QStringListModel(self)
+        self.activity_list = QListView()
+        self.activity_list.setModel(self.activity_model)
+        self.activity_list.setUniformItemSizes(True)
+        self.activity_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.activity_list.setObjectName("ActivityList")
         activity_layout.addWidget(self.activity_list)
         
         activity_group.setLayout(activity_layout)
@@ -236,27 +277,14 @@ class MainWindow(QMainWindow):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search clipboard history...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-        """)
-        self.search_input.textChanged.connect(self.filter_history)
+        self.search_input.setObjectName("HistorySearch")
+        self.search_input.textChanged.connect(self._filter_timer.start)
         search_layout.addWidget(self.search_input)
         
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["All", "Text", "Images", "URLs", "Code"])
-        self.filter_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-        """)
-        self.filter_combo.currentTextChanged.connect(lambda: self.filter_history(self.search_input.text()))
+        self.filter_combo.setObjectName("HistoryFilter")
+        self.filter_combo.currentTextChanged.connect(self._filter_timer.start)
         search_layout.addWidget(self.filter_combo)
         
         clear_btn = QPushButton("Clear History")
@@ -265,16 +293,20 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(search_layout)
         
-        # History list
-        self.history_scroll = QScrollArea()
-        self.history_container = QWidget()
-        self.history_layout = QVBoxLayout()
-        self.history_layout.addStretch()
-        self.history_container.setLayout(self.history_layout)
-        self.history_scroll.setWidget(self.history_container)
-        self.history_scroll.setWidgetResizable(True)
+        # History list - rows are painted by the delegate, not one widget each
+        self.history_model = HistoryModel(self)
+        self.history_delegate = HistoryDelegate(self)
+        self.history_delegate.copy_requested.connect(self.copy_history_item)
+        
+        self.history_view = QListView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setItemDelegate(self.history_delegate)
+        self.history_view.setUniformItemSizes(True)
+        self.history_view.setMouseTracking(True)
+        self.history_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.history_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
-        layout.addWidget(self.history_scroll)
+        layout.addWidget(self.history_view)
         
         widget.setLayout(layout)
         return widget
@@ -287,28 +319,22 @@ class MainWindow(QMainWindow):
         
         # Cloud relay status card
         self.cloud_status_card = QWidget()
-        self.cloud_status_card.setStyleSheet("""
-            QWidget {
-                background-color: #FFF3E0;
-                border-radius: 6px;
-                margin-bottom: 10px;
-            }
-        """)
+        self.cloud_status_card.setObjectName("CloudStatusCard")
         cloud_card_layout = QVBoxLayout()
         cloud_card_layout.setContentsMargins(12, 12, 12, 12)
         
         self.cloud_status_label = QLabel("☁️ Cloud Relay: Not connected")
-        self.cloud_status_label.setStyleSheet("font-weight: bold; color: #E65100;")
+        self.cloud_status_label.setObjectName("CloudStatus")
         cloud_card_layout.addWidget(self.cloud_status_label)
         
         self.cloud_details_label = QLabel("Click '☁️ Cloud Relay' button to connect to mobile devices")
-        self.cloud_details_label.setStyleSheet("color: #666; font-size: 11px;")
+        self.cloud_details_label.setObjectName("CloudDetails")
         self.cloud_details_label.setWordWrap(True)
         cloud_card_layout.addWidget(self.cloud_details_label)
         
         # Device list label
         self.cloud_devices_label = QLabel("")
-        self.cloud_devices_label.setStyleSheet("color: #444; font-size: 11px; margin-top: 8px;")
+        self.cloud_devices_label.setObjectName("CloudDevices")
         self.cloud_devices_label.setWordWrap(True)
         self.cloud_devices_label.setVisible(False)
         cloud_card_layout.addWidget(self.cloud_devices_label)
@@ -420,7 +446,7 @@ class MainWindow(QMainWindow):
         """Create a statistics card widget"""
         card = QWidget()
         card.setFixedSize(200, 120)
-        card.setStyleSheet(styles.CARD)
+        card.setObjectName("Card")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
@@ -429,7 +455,7 @@ class MainWindow(QMainWindow):
         top_layout = QHBoxLayout()
         
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 28px;")
+        icon_label.setObjectName("StatIcon")
         top_layout.addWidget(icon_label)
         
         top_layout.addStretch()
@@ -438,12 +464,12 @@ class MainWindow(QMainWindow):
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: #666; font-size: 12px;")
+        title_label.setObjectName("StatTitle")
         layout.addWidget(title_label)
         
         # Value
         self.value_label = QLabel(value)
-        self.value_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #333;")
+        self.value_label.setObjectName("StatValue")
         layout.addWidget(self.value_label)
         
         layout.addStretch()
@@ -457,10 +483,14 @@ class MainWindow(QMainWindow):
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setToolTip("Clipboard Sync Tool")
         
-        # Create simple icon
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.green)
-        self.tray_icon.setIcon(QIcon(pixmap))
+        # Simple dot icons, built once: green while syncing, red while paused
+        self._tray_icons = {}
+        for syncing, color in ((True, Qt.GlobalColor.green), (False, Qt.GlobalColor.red)):
+            pixmap = QPixmap(16, 16)
+            pixmap.fill(color)
+            self._tray_icons[syncing] = QIcon(pixmap)
+        self.tray_icon.setIcon(self._tray_icons[True])
+        self.setWindowIcon(self._tray_icons[True])
         
         # Create tray menu
         tray_menu = QMenu()
@@ -484,6 +514,15 @@ class MainWindow(QMainWindow):
         if CORE_AVAILABLE:
             try:
                 self.sync_engine = SyncEngine()
+                
+                # Engine listeners arrive on the GUI thread as queued signals
+                self.engine_signals = EngineSignals(self)
+                self.engine_signals.clipboard_captured.connect(self.on_clipboard_captured)
+                self.engine_signals.cloud_item_received.connect(self.on_cloud_item_received)
+                self.engine_signals.devices_changed.connect(self.on_devices_changed)
+                self.engine_signals.cloud_relay_changed.connect(self.on_cloud_relay_changed)
+                self.engine_signals.attach(self.sync_engine)
+                
                 # Start the full sync engine (monitor + network)
                 self.sync_engine.start()
                 
@@ -493,19 +532,10 @@ class MainWindow(QMainWindow):
                     self.pairing_server.start(on_pair_callback=self.on_device_paired)
                     print(f"✅ Pairing server ready at: {self.pairing_server.get_pairing_url()}")
                 
-                # Create a timer to poll for new clipboard items
-                self.poll_timer = QTimer()
-                self.poll_timer.timeout.connect(self.check_for_new_items)
-                self.poll_timer.start(500)  # Check every 500ms
-                
-                # Track last cloud relay item to avoid duplicates
-                self._last_cloud_history_len = 0
-                
                 self.status_label.setText("🟢 Sync Active")
                 print("✅ Sync engine started successfully")
             except Exception as e:
                 print(f"❌ Could not start sync engine: {e}")
-                import traceback
                 traceback.print_exc()
                 self.setup_simple_mode()
     
@@ -515,201 +545,150 @@ class MainWindow(QMainWindow):
                               f"Successfully paired with {device.name}!")
         self.update_devices_display()
 
-    def check_for_new_items(self):
-        """Check if monitor has new items and add them to GUI"""
-        if not self.sync_engine or not self.sync_engine.monitor:
+    def on_clipboard_captured(self, latest):
+        """Add a clipboard item captured by the monitor to the GUI"""
+        # Skip items seen recently
+        if not self._remember_checksum(latest.checksum):
             return
         
-        # Check for cloud relay received items
-        self._check_cloud_relay_history()
-        
-        # Get recent history from monitor
-        monitor_history = self.sync_engine.monitor.get_history(1)
+        # Add to GUI
+        raw = latest.content
+        content_type = latest.content_type.value
+        if isinstance(raw, (bytes, bytearray)):
+            # Binary items (images) are listed by a short description instead of decoding the whole blob
+            meta = latest.metadata or {}
+            size = f"{meta['width']}×{meta['height']}, " if 'width' in meta else ''
+            content = f"[{content_type.title()} {size}{len(raw) // 1024} KB]"
+        else:
+            content = str(raw)
+            raw = None
         
-        if monitor_history:
-            latest = monitor_history[0]
-            
-            # Check if this is a new item
-            if not self.clipboard_history or (
-                self.clipboard_history and 
-                latest.checksum != self.clipboard_history[0].get('checksum')
-            ):
-                # Add to GUI
-                content = latest.content
-                if isinstance(content, bytes):
-                    content = content.decode('utf-8', errors='ignore')
-                
-                # Add to our history
-                self.clipboard_history.insert(0, {
-                    'content': str(content),
-                    'timestamp': latest.timestamp,
-                    'type': latest.content_type.value,
-                    'checksum': latest.checksum,
-                    'device': 'Local'
-                })
-                
-                # Create widget and add to GUI
-                item_widget = ClipboardItemWidget(
-                    content=str(content),
-                    content_type=latest.content_type.value,
-                    timestamp=latest.timestamp,
-                    device='Local',
-                    is_sent=True
-                )
-                
-                # Remove stretch, add widget, re-add stretch
-                if self.history_layout.count() > 0:
-                    last_item = self.history_layout.itemAt(self.history_layout.count() - 1)
-                    if isinstance(last_item, QSpacerItem):
-                        self.history_layout.removeItem(last_item)
-                
-                self.history_layout.insertWidget(0, item_widget)
-                self.history_widgets.append(item_widget)
-                self.history_layout.addStretch()
-                
-                # Update activity list
-                activity_text = f"[{latest.timestamp.strftime('%H:%M:%S')}] {latest.content_type.value.title()}: {str(content)[:50]}..."
-                self.activity_list.insertItem(0, activity_text)
-                
-                # Update stats
-                self.total_syncs_card.value_label.setText(str(len(self.clipboard_history)))
+        self._add_local_item(content, content_type, latest.timestamp, raw)
+    
+    def on_cloud_item_received(self, item):
+        """Show an item received from the cloud relay"""
+        hhmmss = item.timestamp.strftime('%H:%M:%S')
+        
+        # Add to activity list
+        activity_text = f"📥 [{hhmmss}] {item.content_type.title()} from {item.device}: {item.content[:40]}..."
+        self._push_activity(activity_text)
+        
+        # Create row for history tab (if text)
+        if item.content_type == 'text' and item.content:
+            self._add_history_row(
+                content=item.content,
+                content_type=item.content_type,
+                timestamp=item.timestamp,
+                device=item.device,
+                is_sent=False,  # Received, not sent
+                hhmmss=hhmmss
+            )
+        
+        print(f"📥 Cloud relay item added to GUI: {item.content[:50]}...")
+        
+        # Play notification sound
+        self.play_notification_sound()
     
-    def _check_cloud_relay_history(self):
-        """Check for new cloud relay items in sync history"""
-        if not hasattr(self, '_last_cloud_history_len'):
-            self._last_cloud_history_len = 0
-            
-        sync_history = self.sync_engine.get_sync_history(10)
-        current_len = len(sync_history)
-        
-        # Check for new received items from cloud relay
-        for item in sync_history[:max(0, current_len - self._last_cloud_history_len)]:
-            if item.get('action') == 'received' and item.get('data', {}).get('source') == 'cloud_relay':
-                data = item['data']
-                content = data.get('content', '')
-                content_type = data.get('content_type', 'text')
-                device = data.get('device', 'Cloud Relay')
-                
-                # Parse timestamp
-                from datetime import datetime as dt
-                try:
-                    timestamp = dt.fromisoformat(item.get('timestamp', dt.now().isoformat()))
-                except:
-                    timestamp = dt.now()
-                
-                # Add to activity list
-                activity_text = f"📥 [{timestamp.strftime('%H:%M:%S')}] {content_type.title()} from {device}: {content[:40]}..."
-                self.activity_list.insertItem(0, activity_text)
-                while self.activity_list.count() > 10:
-                    self.activity_list.takeItem(self.activity_list.count() - 1)
-                
-                # Create widget for history tab (if text)
-                if content_type == 'text' and content:
-                    item_widget = ClipboardItemWidget(
-                        content=content,
-                        content_type=content_type,
-                        timestamp=timestamp,
-                        device=device,
-                        is_sent=False  # Received, not sent
-                    )
-                    
-                    # Remove stretch, add widget, re-add stretch
-                    if self.history_layout.count() > 0:
-                        last_item = self.history_layout.itemAt(self.history_layout.count() - 1)
-                        if isinstance(last_item, QSpacerItem):
-                            self.history_layout.removeItem(last_item)
-                    
-                    self.history_layout.insertWidget(0, item_widget)
-                    self.history_widgets.append(item_widget)
-                    self.history_layout.addStretch()
-                
-                print(f"📥 Cloud relay item added to GUI: {content[:50]}...")
-                
-                # Play notification sound
-                self.play_notification_sound()
-        
-        self._last_cloud_history_len = current_len
-
     def add_to_history_simple(self, content: str):
         """Add item to history in simple mode"""
-        timestamp = datetime.now()
-        
-        # Add to internal list
-        self.clipboard_history.insert(0, {
-            'content': content,
-            'timestamp': timestamp,
-            'type': 'text',
-            'device': 'Local'
-        })
-        
-        # Determine content type
-        content_type = 'text'
-        if content.startswith(('http://', 'https://')):
-            content_type = 'url'
-        elif any(keyword in content.lower() for keyword in ['def ', 'class ', 'import ', 'function']):
-            content_type = 'code'
-        
-        # Create the widget for history tab
-        item_widget = ClipboardItemWidget(
+        checksum = hashlib.sha256(content.encode()).hexdigest()
+        if not self._remember_checksum(checksum):
+            return
+        
+        self._add_local_item(content, classify_content(content), datetime.now())
+        
+        print(f"Added to history: {content[:50]}... (Total items: {self._total_syncs})")
+    
+    def _add_local_item(self, content: str, content_type: str, timestamp: datetime,
+                        raw: Optional[bytes] = None):
+        """Record a locally copied item in the history tab and Recent Activity"""
+        hhmmss = timestamp.strftime('%H:%M:%S')
+        
+        # Add the row to the history tab (binary items keep their bytes for Copy)
+        self._add_history_row(
             content=content,
             content_type=content_type,
             timestamp=timestamp,
             device='Local',
-            is_sent=True
+            is_sent=True,
+            hhmmss=hhmmss,
+            data=raw
         )
         
-        # Add to history layout (remove stretch first if it exists)
-        if self.history_layout.count() > 0:
-            last_item = self.history_layout.itemAt(self.history_layout.count() - 1)
-            if isinstance(last_item, QSpacerItem):
-                self.history_layout.removeItem(last_item)
-        
-        # Insert at the beginning
-        self.history_layout.insertWidget(0, item_widget)
-        self.history_widgets.append(item_widget)
-        
-        # Re-add stretch at the end
-        self.history_layout.addStretch()
-        
-        # Limit history widgets
-        while len(self.history_widgets) > 100:
-            widget = self.history_widgets.pop()
-            self.history_layout.removeWidget(widget)
-            widget.deleteLater()
-        
         # Update activity list in dashboard
-        activity_text = f"[{timestamp.strftime('%H:%M:%S')}] {content_type.title()}: {content[:50]}..."
-        self.activity_list.insertItem(0, activity_text)
-        while self.activity_list.count() > 10:
-            self.activity_list.takeItem(self.activity_list.count() - 1)
+        self._push_activity(f"[{hhmmss}] {content_type.title()}: {content[:50]}...")
         
         # Update stats
-        self.total_syncs_card.value_label.setText(str(len(self.clipboard_history)))
+        self._total_syncs += 1
+    
+    def _remember_checksum(self, checksum: str) -> bool:
+        """Record a checksum; returns False if it was already among the recent ones"""
+        if checksum in self._seen_checksums:
+            self._seen_checksums.move_to_end(checksum)
+            return False
+        
+        self._seen_checksums[checksum] = None
+        if len(self._seen_checksums) > self.MAX_SEEN_CHECKSUMS:
+            self._seen_checksums.popitem(last=False)
+        return True
+    
+    def _add_history_row(self, content: str, content_type: str, timestamp: datetime,
+                         device: str, is_sent: bool, hhmmss: Optional[str] = None,
+                         data: Optional[bytes] = None):
+        """Insert a history row at the top and index it for search"""
+        item_id = self._next_history_id
+        self._next_history_id += 1
+        
+        self.history_model.prepend(
+            make_history_row(item_id, content, content_type, timestamp, device, is_sent, hhmmss, data)
+        )
+        self._history_index.add(item_id, content, classify_content(content))
         
-        # Force UI update
-        self.history_container.update()
-        QApplication.processEvents()
+        # Respect the active search/filter for the new row
+        search_text = self.search_input.text()
+        kind = FILTER_KINDS.get(self.filter_combo.currentText().lower())
+        if self._history_index.matches(item_id, search_text, kind):
+            self._history_visible.add(item_id)
+        else:
+            self.history_view.setRowHidden(0, True)
         
-        print(f"Added to history: {content[:50]}... (Total items: {len(self.clipboard_history)})")
+        # Drop the oldest rows past the limit
+        overflow = self.history_model.rowCount() - MAX_HISTORY_ROWS
+        for row in self.history_model.remove_oldest(overflow):
+            self._history_index.remove(row['id'])
+            self._history_visible.discard(row['id'])
+    
+    def _push_activity(self, text: str):
+        """Add a Recent Activity entry; the dashboard is refreshed once per burst"""
+        self._activity.appendleft(text)
+        if not self._dashboard_flush_pending:
+            self._dashboard_flush_pending = True
+            QTimer.singleShot(0, self._flush_dashboard)
+    
+    def _flush_dashboard(self):
+        """Push buffered activity entries and the sync count to the dashboard"""
+        self._dashboard_flush_pending = False
+        self.activity_model.setStringList(list(self._activity))
+        self.total_syncs_card.value_label.setText(str(self._total_syncs))
     
-    def setup_timers(self):
-        """Setup update timers"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_ui)
-        self.update_timer.start(5000)  # Update every 5 seconds
+    def copy_history_item(self, index: QModelIndex):
+        """Copy a history row back to the clipboard"""
+        QApplication.clipboard().setMimeData(
+            history_mime_data(str(index.data(CONTENT_ROLE)), index.data(DATA_ROLE))
+        )
+        QToolTip.showText(QCursor.pos(), "✅ Copied to clipboard", self.history_view)
+    
+    def on_devices_changed(self):
+        """Refresh device count and lists when the engine reports a device change"""
+        self.update_devices_display()
     
-    def update_ui(self):
-        """Update UI with latest data"""
+    def on_cloud_relay_changed(self):
+        """Refresh the cloud relay card when its connection or room devices change"""
         if self.sync_engine and CORE_AVAILABLE:
             try:
-                # Update device count
-                devices = self.sync_engine.get_paired_devices()
-                self.device_count_label.setText(f"{len(devices)} devices connected")
-                
-                # Update cloud relay status
                 if self.sync_engine.is_cloud_relay_connected():
                     self.cloud_status_label.setText("☁️ Cloud Relay: ✅ Connected")
-                    self.cloud_status_label.setStyleSheet("font-weight: bold; color: #2E7D32;")
+                    self._set_cloud_card_connected(True)
                     
                     # Show connection details
                     if hasattr(self.sync_engine, 'cloud_relay') and self.sync_engine.cloud_relay:
@@ -718,99 +697,134 @@ class MainWindow(QMainWindow):
                         device_name = self.sync_engine.cloud_relay.device_name
                         self.cloud_details_label.setText(f"Server: {server}\nRoom: {room_id}\nYour device: {device_name}")
                         
-                        # Show device list if available
-                        if hasattr(self.sync_engine.cloud_relay, 'devices') and self.sync_engine.cloud_relay.devices:
-                            device_icons = {'desktop': '🖥️', 'mobile': '📱', 'tablet': '📱'}
-                            device_list = []
-                            for device in self.sync_engine.cloud_relay.devices:
-                                icon = device_icons.get(device.get('deviceType', 'desktop'), '🖥️')
-                                name = device.get('deviceName', 'Unknown')
-                                is_you = ' (You)' if device.get('deviceId') == self.sync_engine.cloud_relay.device_id else ''
-                                device_list.append(f"{icon} {name}{is_you}")
-                            
-                            self.cloud_devices_label.setText("Connected devices:\n" + "\n".join(device_list))
+                        # Show device list if available, rebuilding the text only when it changed
+                        devices = self.sync_engine.cloud_devices
+                        if devices:
+                            own_id = self.sync_engine.cloud_relay.device_id
+                            key = (own_id, tuple((d.get('deviceId'), d.get('deviceName'), d.get('deviceType'))
+                                                 for d in devices))
+                            if key != self._cloud_devices_key:
+                                self._cloud_devices_key = key
+                                device_icons = {'desktop': '🖥️', 'mobile': '📱', 'tablet': '📱'}
+                                device_list = []
+                                for device in devices:
+                                    icon = device_icons.get(device.get('deviceType', 'desktop'), '🖥️')
+                                    name = device.get('deviceName', 'Unknown')
+                                    is_you = ' (You)' if device.get('deviceId') == own_id else ''
+                                    device_list.append(f"{icon} {name}{is_you}")
+                                
+                                self.cloud_devices_label.setText("Connected devices:\n" + "\n".join(device_list))
                             self.cloud_devices_label.setVisible(True)
                         else:
                             self.cloud_devices_label.setVisible(False)
                         
-                        self.cloud_status_card.setStyleSheet("""
-                            QWidget {
-                                background-color: #E8F5E9;
-                                border-radius: 6px;
-                                margin-bottom: 10px;
-                            }
-                        """)
                         self.cloud_test_btn.setVisible(True)
                 else:
                     self.cloud_status_label.setText("☁️ Cloud Relay: Not connected")
-                    self.cloud_status_label.setStyleSheet("font-weight: bold; color: #E65100;")
+                    self._set_cloud_card_connected(False)
                     self.cloud_details_label.setText("Click '☁️ Cloud Relay' button to connect to mobile devices")
                     self.cloud_devices_label.setVisible(False)
-                    self.cloud_status_card.setStyleSheet("""
-                        QWidget {
-                            background-color: #FFF3E0;
-                            border-radius: 6px;
-                            margin-bottom: 10px;
-                        }
-                    """)
                     self.cloud_test_btn.setVisible(False)
-                
-                # Update devices tab
-                self.update_devices_display()
-            except:
-                pass
+            except Exception as e:
+                self._report_error("Could not update cloud relay status", e)
+    
+    def _report_error(self, context: str, error: Exception):
+        """Print an error from a signal-driven refresh once instead of on every repeat"""
+        key = (context, type(error).__name__, str(error))
+        if key not in self._reported_errors:
+            self._reported_errors.add(key)
+            print(f"⚠️ {context}: {error}")
+    
+    def _set_cloud_card_connected(self, connected: bool):
+        """Switch the cloud card's [connected] style rules and re-polish it"""
+        if bool(self.cloud_status_card.property("connected")) == connected:
+            return
+        
+        self.cloud_status_card.setProperty("connected", connected)
+        self.cloud_status_label.setProperty("connected", connected)
+        style = self.cloud_status_card.style()
+        for widget in [self.cloud_status_card, *self.cloud_status_card.findChildren(QLabel)]:
+            style.unpolish(widget)
+            style.polish(widget)
     
     def update_devices_display(self):
-        """Update the devices display"""
+        """Update the device count and device lists"""
         if not self.sync_engine or not CORE_AVAILABLE:
             return
         
         try:
-            # Clear current displays
-            while self.discovered_layout.count() > 1:
-                item = self.discovered_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            while self.paired_layout.count() > 1:
-                item = self.paired_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
             # Get paired and discovered devices
             paired_devices = self.sync_engine.get_paired_devices()
-            all_discovered = self.sync_engine.get_discovered_devices()
-            paired_ids = {d.device_id for d in paired_devices}
+            self.device_count_label.setText(f"{len(paired_devices)} devices connected")
             
-            # Add paired devices first
-            for device in paired_devices:
-                device_widget = DeviceWidget({'name': device.name, 'status': 'paired', 
-                                             'ip_address': device.ip_address})
-                # Connect disconnect button
-                if hasattr(device_widget, 'pair_btn'):
-                    device_widget.pair_btn.setText('Disconnect')
-                    device_widget.pair_btn.clicked.connect(lambda checked, d=device: self.disconnect_device(d))
-                self.paired_layout.insertWidget(self.paired_layout.count() - 1, device_widget)
+            # Device widgets are only reconciled while their tab is on screen
+            if not self.isVisible() or self.tabs.currentWidget() is not self.devices_tab:
+                self._devices_dirty = True
+                return
+            self._devices_dirty = False
             
-            # Add discovered devices (excluding already paired)
-            for device in all_discovered:
-                if device.device_id in paired_ids:
-                    continue  # Skip devices already in paired list
-                device_widget = DeviceWidget({'name': device.name, 'status': 'discovered', 
-                                             'ip_address': device.ip_address})
-                # Connect button directly to pair_device with the actual Device object
-                if hasattr(device_widget, 'pair_btn'):
-                    device_widget.pair_btn.clicked.connect(lambda checked, d=device: self.pair_device(d))
-                self.discovered_layout.insertWidget(0, device_widget)
+            paired_ids = {d.device_id for d in paired_devices}
+            discovered_devices = [d for d in self.sync_engine.get_discovered_devices()
+                                  if d.device_id not in paired_ids]
             
-            # Add paired devices
-            paired = self.sync_engine.get_paired_devices()
-            for device in paired:
-                device_widget = DeviceWidget({'name': device.name, 'status': 'paired',
-                                             'ip_address': device.ip_address})
-                self.paired_layout.insertWidget(0, device_widget)
-        except:
-            pass
+            # Only add, remove or update the widgets that changed
+            self._sync_device_widgets(self.paired_layout, self._paired_widgets,
+                                      paired_devices, 'paired')
+            self._sync_device_widgets(self.discovered_layout, self._discovered_widgets,
+                                      discovered_devices, 'discovered')
+        except Exception as e:
+            self._report_error("Could not update device list", e)
+    
+    def _on_tab_changed(self, index: int):
+        """Catch the Devices tab up on changes made while it was hidden"""
+        if self._devices_dirty and self.tabs.widget(index) is self.devices_tab:
+            self.update_devices_display()
+    
+    def showEvent(self, event):
+        """Catch the Devices tab up when the window comes back from the tray"""
+        super().showEvent(event)
+        if self._devices_dirty and self.tabs.currentWidget() is self.devices_tab:
+            self.update_devices_display()
+    
+    def _sync_device_widgets(self, layout: QVBoxLayout, widgets: dict, devices: list, status: str):
+        """Reconcile one device section with the current device list, keyed by device_id"""
+        current = {device.device_id: device for device in devices}
+        removed = widgets.keys() - current.keys()
+        
+        # Hold repaints while widgets come and go so the section is redrawn once
+        container = layout.parentWidget()
+        batch = bool(removed or current.keys() - widgets.keys())
+        if batch:
+            container.setUpdatesEnabled(False)
+        
+        try:
+            for device_id in removed:
+                widget = widgets.pop(device_id)
+                layout.removeWidget(widget)
+                widget.deleteLater()
+            
+            for device_id, device in current.items():
+                info = {'name': device.name, 'status': status, 'ip_address': device.ip_address}
+                widget = widgets.get(device_id)
+                if widget is None:
+                    widget = DeviceWidget(info)
+                    if widget.pair_btn:
+                        widget.pair_btn.setProperty('device_id', device_id)
+                        widget.pair_btn.clicked.connect(self._on_pair_clicked)
+                    layout.insertWidget(layout.count() - 1, widget)  # Above the stretch
+                    widgets[device_id] = widget
+                else:
+                    widget.update_state(info)
+                widget.device_ref = device
+        finally:
+            if batch:
+                container.setUpdatesEnabled(True)
+    
+    def _on_pair_clicked(self):
+        """Pair with the discovered device whose Pair button was clicked"""
+        widget = self._discovered_widgets.get(self.sender().property('device_id'))
+        if widget is not None:
+            self.pair_device(widget.device_ref)
     
     def toggle_sync(self):
         """Toggle sync on/off"""
@@ -833,7 +847,6 @@ class MainWindow(QMainWindow):
                         self.is_syncing = False
             except Exception as e:
                 print(f"❌ Error stopping sync: {e}")
-                import traceback
                 traceback.print_exc()
                 # Reset UI state on error
                 self.status_label.setText("⚠️ Sync Error")
@@ -858,7 +871,6 @@ class MainWindow(QMainWindow):
                         self.is_syncing = True
             except Exception as e:
                 print(f"❌ Error starting sync: {e}")
-                import traceback
                 traceback.print_exc()
                 # Reset UI state on error
                 self.status_label.setText("⚠️ Sync Error")
@@ -869,9 +881,112 @@ class MainWindow(QMainWindow):
                     "Sync Error",
                     f"Failed to resume sync:\n\n{str(e)}\n\nTry restarting the application."
                 )
+        
+        self.tray_icon.setIcon(self._tray_icons[self.is_syncing])
+    
+    @staticmethod
+    def _render_qr_image(data: str, size: int = 200) -> QImage:
+        """
+        Encode data as a QR code image, one bit per module (runs off the GUI thread).
+        
+        The module matrix is packed straight into a Format_Mono QImage, so
+        there is no PIL image or PNG encode/decode in between. segno is used
+        for encoding when installed, qrcode otherwise.
+        """
+        try:
+            import segno
+        except ImportError:
+            segno = None
+        
+        if segno is not None:
+            qr = segno.make_qr(data, error='m')
+            matrix = [list(row) for row in qr.matrix_iter(scale=1, border=2)]
+        else:
+            import qrcode
+            
+            qr = qrcode.QRCode(version=1, border=2)
+            qr.add_data(data)
+            qr.make(fit=True)
+            matrix = qr.get_matrix()
+        
+        width = len(matrix)
+        bytes_per_line = (width + 7) // 8
+        padding = bytes_per_line * 8 - width
+        bits = bytearray()
+        for row in matrix:
+            line = 0
+            for dark in row:
+                line = (line << 1) | dark
+            bits += (line << padding).to_bytes(bytes_per_line, 'big')
+        
+        image = QImage(bytes(bits), width, width, bytes_per_line, QImage.Format.Format_Mono)
+        image.setColorTable([QColor('white').rgb(), QColor('black').rgb()])
+        return image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.FastTransformation)
     
     def show_qr_code(self):
-        """Show QR code for pairing"""
+        """Show QR code for pairing (the dialog is built once and refreshed on each open)"""
+        if self._qr_dialog is None:
+            self._qr_dialog = self._build_qr_dialog()
+        dialog = self._qr_dialog
+        
+        self._qr_tabs.setCurrentIndex(0)
+        self._qr_input.clear()
+        self._qr_label.setStyleSheet("")
+        
+        if self.sync_engine and CORE_AVAILABLE:
+            try:
+                # The payload only changes with the device's identity or address
+                engine = self.sync_engine
+                key = (engine.device_id, engine.device_name,
+                       engine.discovery.local_ip, engine.discovery.port)
+                if key == self._pairing_key and self._pairing_pixmap is not None:
+                    self._qr_json_text.setPlainText(self._pairing_data)
+                    self._qr_copy_btn.setEnabled(True)
+                    self._qr_label.setPixmap(self._pairing_pixmap)
+                    dialog.exec()
+                    return
+                
+                # Generate pairing JSON data
+                pairing_data = engine.generate_pairing_qr()
+                self._qr_json_text.setPlainText(pairing_data)
+                self._qr_copy_btn.setEnabled(True)
+                
+                # Encode the QR code on a worker thread; only the pixmap is built here.
+                # Results from an earlier open are dropped.
+                self._qr_generation += 1
+                generation = self._qr_generation
+                
+                def on_qr_ready(image, error):
+                    if generation != self._qr_generation:
+                        return
+                    if error is not None:
+                        self._qr_label.setText(f"❌ Generation failed\n\n{str(error)}")
+                        self._qr_label.setStyleSheet("color: red;")
+                        return
+                    self._pairing_key = key
+                    self._pairing_data = pairing_data
+                    self._pairing_pixmap = QPixmap.fromImage(image)
+                    self._qr_label.setPixmap(self._pairing_pixmap)
+                
+                self._qr_label.setText("Generating QR code...")
+                run_in_thread_pool(lambda: self._render_qr_image(pairing_data), on_qr_ready, dialog)
+                
+            except Exception as e:
+                self._qr_label.setText(f"❌ Generation failed\n\n{str(e)}")
+                self._qr_label.setStyleSheet("color: red;")
+                self._qr_json_text.setPlainText("Error generating pairing data")
+                self._qr_copy_btn.setEnabled(False)
+        else:
+            self._qr_label.setText("❌ Network sync not available")
+            self._qr_label.setStyleSheet("color: red;")
+            self._qr_json_text.setPlainText("Core modules not loaded - running in simple mode")
+            self._qr_copy_btn.setEnabled(False)
+        
+        dialog.exec()
+    
+    def _build_qr_dialog(self) -> QDialog:
+        """Create the pairing dialog's widgets; show_qr_code fills in the data"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Device Pairing")
         dialog.setFixedSize(500, 650)
@@ -879,7 +994,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout()
         
         # Tab widget for show/scan options
-        tab_widget = QTabWidget()
+        self._qr_tabs = QTabWidget()
         
         # Tab 1: Show QR Code
         show_tab = QWidget()
@@ -890,87 +1005,33 @@ class MainWindow(QMainWindow):
         label.setStyleSheet("font-size: 14px; font-weight: bold; margin: 10px;")
         show_layout.addWidget(label)
         
-        # Generate QR code
-        qr_label = QLabel()
-        qr_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        qr_label.setMinimumHeight(200)
+        # QR code, filled in when generation finishes
+        self._qr_label = QLabel()
+        self._qr_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._qr_label.setMinimumHeight(200)
         
         # JSON data text box (copyable)
-        json_text = QTextEdit()
-        json_text.setReadOnly(True)
-        json_text.setStyleSheet("""
-            QTextEdit {
-                border: 2px solid #4CAF50;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                background: #f9f9f9;
-            }
-        """)
-        json_text.setMaximumHeight(150)
+        self._qr_json_text = QTextEdit()
+        self._qr_json_text.setReadOnly(True)
+        self._qr_json_text.setObjectName("PairingJson")
+        self._qr_json_text.setMaximumHeight(150)
         
         # Copy button
         copy_btn = QPushButton("📋 Copy JSON Data")
-        copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        copy_btn.setObjectName("DialogPrimary")
         
-        if self.sync_engine and CORE_AVAILABLE:
-            try:
-                # Generate pairing JSON data
-                pairing_data = self.sync_engine.generate_pairing_qr()
-                json_text.setPlainText(pairing_data)
-                
-                # Generate QR code with the JSON
-                qr = qrcode.QRCode(version=1, box_size=6, border=2)
-                qr.add_data(pairing_data)
-                qr.make(fit=True)
-                
-                img = qr.make_image(fill_color="black", back_color="white")
-                
-                # Convert PIL image to QPixmap
-                buffer = io.BytesIO()
-                img.save(buffer, format='PNG')
-                buffer.seek(0)
-                
-                pixmap = QPixmap()
-                pixmap.loadFromData(buffer.read())
-                qr_label.setPixmap(pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio))
-                
-                # Copy button functionality
-                def copy_json():
-                    clipboard = QApplication.clipboard()
-                    clipboard.setText(pairing_data)
-                    copy_btn.setText("✅ Copied!")
-                    QTimer.singleShot(2000, lambda: copy_btn.setText("📋 Copy JSON Data"))
-                
-                copy_btn.clicked.connect(copy_json)
-                
-            except Exception as e:
-                qr_label.setText(f"❌ Generation failed\n\n{str(e)}")
-                qr_label.setStyleSheet("color: red;")
-                json_text.setPlainText("Error generating pairing data")
-                copy_btn.setEnabled(False)
-        else:
-            qr_label.setText("❌ Network sync not available")
-            qr_label.setStyleSheet("color: red;")
-            json_text.setPlainText("Core modules not loaded - running in simple mode")
-            copy_btn.setEnabled(False)
+        def copy_json():
+            clipboard = QApplication.clipboard()
+            clipboard.setText(self._qr_json_text.toPlainText())
+            copy_btn.setText("✅ Copied!")
+            QTimer.singleShot(2000, lambda: copy_btn.setText("📋 Copy JSON Data"))
         
-        show_layout.addWidget(qr_label)
+        copy_btn.clicked.connect(copy_json)
+        self._qr_copy_btn = copy_btn
+        
+        show_layout.addWidget(self._qr_label)
         show_layout.addWidget(QLabel("Copy this JSON and paste on the other computer:"))
-        show_layout.addWidget(json_text)
+        show_layout.addWidget(self._qr_json_text)
         show_layout.addWidget(copy_btn)
         
         # Instructions
@@ -997,36 +1058,12 @@ class MainWindow(QMainWindow):
         
         qr_input = QTextEdit()
         qr_input.setPlaceholderText('Paste JSON here:\n{"device_id": "...", "device_name": "...", "ip": "...", "port": ..., "public_key": "...", "timestamp": "..."}')
-        qr_input.setStyleSheet("""
-            QTextEdit {
-                border: 2px solid #2196F3;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                background: #f9f9f9;
-            }
-        """)
+        qr_input.setObjectName("PairingInput")
         scan_layout.addWidget(qr_input)
+        self._qr_input = qr_input
         
         pair_btn = QPushButton("Pair with Device")
-        pair_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        pair_btn.setObjectName("DialogPrimary")
         
         def pair_with_qr():
             qr_text = qr_input.toPlainText().strip()
@@ -1050,28 +1087,19 @@ class MainWindow(QMainWindow):
         scan_tab.setLayout(scan_layout)
         
         # Add tabs
-        tab_widget.addTab(show_tab, "📱 Show QR")
-        tab_widget.addTab(scan_tab, "🔗 Enter QR Data")
+        self._qr_tabs.addTab(show_tab, "📱 Show QR")
+        self._qr_tabs.addTab(scan_tab, "🔗 Enter QR Data")
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self._qr_tabs)
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 20px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+        close_btn.setObjectName("DialogSecondary")
         close_btn.clicked.connect(dialog.close)
         layout.addWidget(close_btn)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
     
     def test_cloud_sync(self):
         """Test cloud relay sync by sending a test message"""
@@ -1083,8 +1111,7 @@ class MainWindow(QMainWindow):
         test_message = f"Test sync from desktop at {datetime.datetime.now().strftime('%H:%M:%S')}"
         
         try:
-            import pyperclip
-            pyperclip.copy(test_message)
+            QApplication.clipboard().setText(test_message)
             QMessageBox.information(self, "Test Sent! 📤", 
                                   f"Test message copied to clipboard:\n\n"
                                   f'"{test_message}"\n\n'
@@ -1092,9 +1119,36 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to send test: {str(e)}")
     
+    @cached_property
+    def _cloud_config(self) -> dict:
+        """Cloud relay deploy config, read once (empty if missing or unreadable)"""
+        try:
+            # The deploy scripts (PowerShell) write the file with a BOM
+            with open(CLOUD_RELAY_CONFIG_PATH, 'r', encoding='utf-8-sig') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @cached_property
+    def _hostname(self) -> str:
+        """Default device name for the cloud relay, looked up once"""
+        import socket
+        import platform
+        try:
+            return socket.gethostname() or platform.node() or "Desktop"
+        except OSError:
+            return "Desktop"
+    
     def show_cloud_relay(self):
-        """Show cloud relay connection dialog"""
+        """Show cloud relay connection dialog (built once, keeps the last entries)"""
+        if self._cloud_dialog is None:
+            self._cloud_dialog = self._build_cloud_dialog()
+        self._cloud_dialog.exec()
+    
+    def _build_cloud_dialog(self) -> QDialog:
+        """Create the cloud relay dialog and its input fields"""
         dialog = QDialog(self)
+        dialog.setObjectName("CloudRelayDialog")
         dialog.setWindowTitle("☁️ Cloud Relay Connection")
         dialog.setFixedSize(500, 400)
         
@@ -1123,30 +1177,11 @@ class MainWindow(QMainWindow):
         self.cloud_url_input.setPlaceholderText("https://your-app.fly.dev")
         
         # Auto-load deployed URL if available
-        import json
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cloud-relay-config.json')
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    url = config.get('cloudRelayUrl')
-                    if url:
-                        self.cloud_url_input.setText(url)
-                        print(f"[INFO] Auto-loaded cloud relay URL: {url}")
-            except Exception as e:
-                pass
-        
-        self.cloud_url_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-            }
-        """)
+        url = self._cloud_config.get('cloudRelayUrl')
+        if url:
+            self.cloud_url_input.setText(url)
+            print(f"[INFO] Auto-loaded cloud relay URL: {url}")
+        
         layout.addWidget(self.cloud_url_input)
         
         # Room ID input
@@ -1156,17 +1191,6 @@ class MainWindow(QMainWindow):
         
         self.room_id_input = QLineEdit()
         self.room_id_input.setPlaceholderText("my-clipboard")
-        self.room_id_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-            }
-        """)
         layout.addWidget(self.room_id_input)
         
         # Encryption Password input (optional)
@@ -1177,17 +1201,6 @@ class MainWindow(QMainWindow):
         self.cloud_password_input = QLineEdit()
         self.cloud_password_input.setPlaceholderText("Leave empty for basic encryption")
         self.cloud_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.cloud_password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-            }
-        """)
         layout.addWidget(self.cloud_password_input)
         
         password_hint = QLabel("💡 Same password must be used on all devices")
@@ -1201,38 +1214,13 @@ class MainWindow(QMainWindow):
         
         self.device_name_input = QLineEdit()
         # Auto-fill with hostname
-        import socket
-        import platform
-        try:
-            hostname = socket.gethostname() or platform.node() or "Desktop"
-        except:
-            hostname = "Desktop"
-        self.device_name_input.setPlaceholderText(hostname)
-        self.device_name_input.setText(hostname)
-        self.device_name_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-            }
-        """)
+        self.device_name_input.setPlaceholderText(self._hostname)
+        self.device_name_input.setText(self._hostname)
         layout.addWidget(self.device_name_input)
         
         # Info box
         info_box = QLabel("💡 Tip: Use the same Room ID on your mobile device to sync clipboards across all your devices!")
-        info_box.setStyleSheet("""
-            QLabel {
-                background-color: #E3F2FD;
-                color: #1976D2;
-                padding: 12px;
-                border-radius: 6px;
-                margin-top: 15px;
-            }
-        """)
+        info_box.setObjectName("CloudTip")
         info_box.setWordWrap(True)
         layout.addWidget(info_box)
         
@@ -1242,42 +1230,19 @@ class MainWindow(QMainWindow):
         btn_layout = QHBoxLayout()
         
         connect_btn = QPushButton("🔌 Connect")
-        connect_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 12px 30px;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        connect_btn.setObjectName("DialogPrimary")
         connect_btn.clicked.connect(lambda: self.connect_to_cloud_relay(dialog))
         btn_layout.addWidget(connect_btn)
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                padding: 12px 30px;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+        cancel_btn.setObjectName("DialogSecondary")
         cancel_btn.clicked.connect(dialog.close)
         btn_layout.addWidget(cancel_btn)
         
         layout.addLayout(btn_layout)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
     
     def connect_to_cloud_relay(self, dialog):
         """Connect to cloud relay with given URL and room ID"""
@@ -1296,12 +1261,7 @@ class MainWindow(QMainWindow):
         
         # Use hostname if device name is empty
         if not device_name:
-            import socket
-            import platform
-            try:
-                device_name = socket.gethostname() or platform.node() or "Desktop"
-            except:
-                device_name = "Desktop"
+            device_name = self._hostname
         
         # Add https:// if not present
         if not url.startswith(('http://', 'https://')):
@@ -1313,19 +1273,10 @@ class MainWindow(QMainWindow):
                               "Sync engine not available. Core modules may not be loaded.")
             return
         
-        # Connect in separate thread to avoid blocking GUI
-        import threading
-        import asyncio
-        from PyQt6.QtCore import QTimer, pyqtSignal
-        
-        # Store connection state
-        self._connection_result = {'success': False, 'error': None}
-        
         # Close the input dialog
         dialog.accept()
         
         # Show non-modal progress message
-        from PyQt6.QtWidgets import QProgressDialog
         progress = QProgressDialog("Connecting to cloud relay...\n" + url, "Cancel", 0, 0, self)
         progress.setWindowTitle("Connecting...")
         progress.setWindowModality(Qt.WindowModality.ApplicationModal)
@@ -1334,55 +1285,40 @@ class MainWindow(QMainWindow):
         progress.setValue(0)
         progress.show()
         
-        def do_connect_thread():
-            """Run connection in thread"""
-            try:
-                # Run async connection
-                future = asyncio.run_coroutine_threadsafe(
-                    self.sync_engine.connect_to_cloud_relay(url, room_id, device_name, password),
-                    self.sync_engine.loop
-                )
-                # Wait for result with timeout
-                success = future.result(timeout=10)
-                self._connection_result = {'success': success, 'error': None}
-            except Exception as e:
-                self._connection_result = {'success': False, 'error': str(e)}
-        
-        # Start connection thread
-        thread = threading.Thread(target=do_connect_thread, daemon=True)
-        thread.start()
-        
-        # Check connection status periodically
-        def check_status():
-            if thread.is_alive():
-                # Still connecting, check again
-                QTimer.singleShot(100, check_status)
+        def on_connected(success, error):
+            """Runs on the GUI thread once the engine loop finishes connecting"""
+            progress.close()
+            
+            if error is None and success:
+                QMessageBox.information(self, "✅ Connected!", 
+                                      f"Successfully connected to cloud relay!\n\n"
+                                      f"Server: {url}\n"
+                                      f"Room: {room_id}\n\n"
+                                      f"Your clipboard is now syncing with mobile devices in this room.")
+                self.status_label.setText("🟢 Sync Active (Cloud + Local)")
+            elif error is not None and str(error):
+                QMessageBox.critical(self, "Error", 
+                                   f"Failed to connect:\n{error}\n\n"
+                                   f"Check the console for more details.")
             else:
-                # Connection complete
-                progress.close()
-                
-                result = self._connection_result
-                if result['success']:
-                    QMessageBox.information(self, "✅ Connected!", 
-                                          f"Successfully connected to cloud relay!\n\n"
-                                          f"Server: {url}\n"
-                                          f"Room: {room_id}\n\n"
-                                          f"Your clipboard is now syncing with mobile devices in this room.")
-                    self.status_label.setText("🟢 Sync Active (Cloud + Local)")
-                elif result['error']:
-                    QMessageBox.critical(self, "Error", 
-                                       f"Failed to connect:\n{result['error']}\n\n"
-                                       f"Check the console for more details.")
-                else:
-                    QMessageBox.warning(self, "Connection Failed", 
-                                      f"Could not connect to cloud relay.\n\n"
-                                      f"Please check:\n"
-                                      f"• Server URL is correct\n"
-                                      f"• Server is running\n"
-                                      f"• Internet connection is working")
-        
-        # Start checking after 100ms
-        QTimer.singleShot(100, check_status)
+                QMessageBox.warning(self, "Connection Failed", 
+                                  f"Could not connect to cloud relay.\n\n"
+                                  f"Please check:\n"
+                                  f"• Server URL is correct\n"
+                                  f"• Server is running\n"
+                                  f"• Internet connection is working")
+        
+        # Run on the engine loop; the result comes back as a queued signal
+        try:
+            run_on_engine_loop(
+                self.sync_engine,
+                self.sync_engine.connect_to_cloud_relay(url, room_id, device_name, password),
+                on_connected,
+                parent=self,
+                timeout=10
+            )
+        except Exception as e:
+            on_connected(None, e)
     
     def pair_device(self, device):
         """Pair with a device"""
@@ -1392,8 +1328,7 @@ class MainWindow(QMainWindow):
                 # Get device name - handle both dict and Device object
                 device_name = device.name if hasattr(device, 'name') else device.get('name', 'device')
                 QMessageBox.information(self, "Success", f"Connecting to {device_name}...")
-                # Refresh display after short delay to show pairing status
-                QTimer.singleShot(1000, self.update_devices_display)
+                # The display refreshes when the engine reports the pairing
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not pair: {str(e)}")
     
@@ -1415,54 +1350,26 @@ class MainWindow(QMainWindow):
                 
                 device_name = device.name if hasattr(device, 'name') else device.get('name', 'device')
                 QMessageBox.information(self, "Disconnected", f"Disconnected from {device_name}")
-                self.update_devices_display()
+                self.on_devices_changed()
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not disconnect: {str(e)}")
     
+    def _apply_filter(self):
+        """Run the filter once the search box has been quiet for a moment"""
+        self.filter_history(self.search_input.text())
+    
     def filter_history(self, text):
         """Filter history based on search text"""
-        search_text = text.lower()
-        filter_type = self.filter_combo.currentText().lower()
+        kind = FILTER_KINDS.get(self.filter_combo.currentText().lower())
+        matches = self._history_index.search(text, kind)
         
-        # Go through all history widgets
-        for widget in self.history_widgets:
-            should_show = True
-            
-            # Check search text match
-            if search_text:
-                content = str(widget.content).lower()
-                if search_text not in content:
-                    should_show = False
-            
-            # Check type filter
-            if filter_type != 'all' and should_show:
-                # Map filter names to content types
-                type_map = {
-                    'text': ['text'],
-                    'images': ['image'],
-                    'urls': ['url'],
-                    'code': ['code']
-                }
-                
-                if filter_type in type_map:
-                    # Need to check the widget's content type
-                    # We'll determine this from the icon or store it in the widget
-                    content = str(widget.content)
-                    widget_type = 'text'
-                    
-                    if content.startswith(('http://', 'https://')):
-                        widget_type = 'url'
-                    elif any(keyword in content.lower() for keyword in ['def ', 'class ', 'import ', 'function']):
-                        widget_type = 'code'
-                    
-                    if widget_type not in type_map[filter_type]:
-                        should_show = False
-            
-            # Show or hide the widget
-            if should_show:
-                widget.show()
-            else:
-                widget.hide()
+        # Only touch rows whose visibility actually changes
+        for history_id in self._history_visible - matches:
+            self.history_view.setRowHidden(self.history_model.row_for_id(history_id), True)
+        for history_id in matches - self._history_visible:
+            self.history_view.setRowHidden(self.history_model.row_for_id(history_id), False)
+        
+        self._history_visible = matches
     
     def clear_history(self):
         """Clear clipboard history"""
@@ -1472,81 +1379,120 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             # Clear internal history
-            self.clipboard_history.clear()
+            self._seen_checksums.clear()
+            self._total_syncs = 0
             
-            # Clear all widgets from the layout
-            for widget in self.history_widgets:
-                self.history_layout.removeWidget(widget)
-                widget.deleteLater()
+            # Clear the rows and search index
+            self.history_model.clear()
+            self._history_index.clear()
+            self._history_visible.clear()
             
-            # Clear the widgets list
-            self.history_widgets.clear()
-            
-            # Remove all items from layout (including any remaining spacers)
-            while self.history_layout.count() > 0:
-                item = self.history_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            # Re-add the stretch at the end
-            self.history_layout.addStretch()
-            
-            # Clear activity list
-            self.activity_list.clear()
-            
-            # Reset stats
-            self.total_syncs_card.value_label.setText("0")
+            # Clear activity list and reset stats
+            self._activity.clear()
+            self._flush_dashboard()
+    
+    def _read_settings(self) -> dict:
+        """Snapshot the settings tab's widgets as update_settings keyword arguments"""
+        return {
+            'auto_sync': self.auto_sync_check.isChecked(),
+            'sync_text': self.sync_text_check.isChecked(),
+            'sync_images': self.sync_images_check.isChecked(),
+            'sync_files': self.sync_files_check.isChecked(),
+            'max_size_mb': self.size_limit_spin.value()
+        }
     
     def save_settings(self):
         """Save settings"""
         if self.sync_engine and CORE_AVAILABLE:
             try:
-                self.sync_engine.update_settings(
-                    auto_sync=self.auto_sync_check.isChecked(),
-                    sync_text=self.sync_text_check.isChecked(),
-                    sync_images=self.sync_images_check.isChecked(),
-                    sync_files=self.sync_files_check.isChecked(),
-                    max_size_mb=self.size_limit_spin.value()
-                )
-            except:
-                pass
+                self.sync_engine.update_settings(**self._read_settings())
+            except (AttributeError, OSError, ValueError) as e:
+                print(f"⚠️ Could not save settings: {e}")
+                QMessageBox.warning(self, "Settings", f"Could not save settings:\n{e}")
+                return
         
         QMessageBox.information(self, "Settings", "Settings saved successfully!")
     
     def quit_application(self):
         """Properly quit the application"""
+        self._quitting = True
         print("Shutting down...")
         
-        # Stop pairing server first
-        if self.pairing_server:
-            try:
-                self.pairing_server.stop()
-                print("✅ Pairing server stopped")
-            except Exception as e:
-                print(f"⚠️ Error stopping pairing server: {e}")
+        # Take the window and tray icon off screen first so nothing repaints while the backends stop
+        self.hide()
+        self.tray_icon.hide()
+        QApplication.processEvents()
         
-        # Stop sync engine
-        if self.sync_engine and CORE_AVAILABLE:
-            try:
-                if self.sync_engine.is_running:
-                    self.sync_engine.stop()
-                    print("✅ Sync engine stopped")
-            except Exception as e:
-                print(f"⚠️ Error stopping sync engine: {e}")
+        self._stop_backends()
         
         print("👋 Goodbye!")
-        QApplication.quit()
+        app = QApplication.instance()
+        app.closeAllWindows()
+        app.exit(0)
+    
+    def _stop_backends(self):
+        """Stop the pairing server and sync engine once, whichever quit path gets here first"""
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+        
+        # Both stops block on socket teardown and thread joins, so run them side by side
+        stops = {}
+        if self.pairing_server:
+            stops["Pairing server"] = self.pairing_server.stop
+        if self.sync_engine and CORE_AVAILABLE and self.sync_engine.is_running:
+            stops["Sync engine"] = self.sync_engine.stop
+        
+        if stops:
+            executor = ThreadPoolExecutor(max_workers=len(stops))
+            futures = {executor.submit(stop): name for name, stop in stops.items()}
+            done, pending = wait(futures, timeout=self.SHUTDOWN_TIMEOUT_S)
+            executor.shutdown(wait=False)
+            
+            for future, name in futures.items():
+                if future in pending:
+                    print(f"⚠️ {name} did not stop in time")
+                elif future.exception() is not None:
+                    print(f"⚠️ Error stopping {name.lower()}: {future.exception()}")
+                else:
+                    print(f"✅ {name} stopped")
+            
+            if pending:
+                # A hung stop would keep the interpreter alive at exit; end the process instead
+                watchdog = threading.Timer(self.SHUTDOWN_GRACE_S, self._force_exit)
+                watchdog.daemon = True
+                watchdog.start()
+    
+    @staticmethod
+    def _force_exit():
+        """End the process, flushing the log sinks and stdout/stderr first since os._exit skips them"""
+        try:
+            logger.complete()
+            logger.remove()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not flush logs before exiting: {e}", file=sys.__stderr__)
+        os._exit(0)
     
     def closeEvent(self, event):
         """Handle window close - quit the application"""
-        # Ask for confirmation
-        reply = QMessageBox.question(
-            self,
-            "Quit Application",
-            "Are you sure you want to quit Clipboard Sync?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
+        # Already quitting (e.g. from the tray menu), don't ask again
+        if self._quitting:
+            event.accept()
+            return
+        
+        # Ask for confirmation; the box is built once and reused
+        if self._quit_box is None:
+            self._quit_box = QMessageBox(
+                QMessageBox.Icon.Question,
+                "Quit Application",
+                "Are you sure you want to quit Clipboard Sync?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                self
+            )
+            self._quit_box.setDefaultButton(QMessageBox.StandardButton.No)
+        reply = self._quit_box.exec()
         
         if reply == QMessageBox.StandardButton.Yes:
             event.accept()
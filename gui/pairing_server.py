@@ -10,7 +10,6 @@ from http.server import HTTPServer, ThreadingHTTPServer, BaseHTTPRequestHandler
 from threading import Thread
 from urllib.parse import parse_qs, urlparse
 from typing import Callable, Optional
-import qrcode
 import io
 import base64
 
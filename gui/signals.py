@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# gui/signals.py
+"""
+Qt signal bridges between the sync engine and the GUI.
+The engine calls its listeners and finishes coroutines on background
+threads; emitting a signal delivers them to slots on the GUI thread
+through a queued connection.
+"""
+
+import asyncio
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+
+class EngineSignals(QObject):
+    """Re-emits SyncEngine listener callbacks as Qt signals"""
+    
+    clipboard_captured = pyqtSignal(object)  # ClipboardContent
+    cloud_item_received = pyqtSignal(object)  # CloudRelayItem
+    devices_changed = pyqtSignal()
+    cloud_relay_changed = pyqtSignal()
+    
+    def attach(self, engine):
+        """Register this bridge as the engine's listeners"""
+        engine.on_clipboard_captured = self.clipboard_captured.emit
+        engine.on_cloud_item_received = self.cloud_item_received.emit
+        engine.on_devices_changed = self.devices_changed.emit
+        engine.on_cloud_relay_changed = self.cloud_relay_changed.emit
+
+
+class CoroutineWatcher(QObject):
+    """Delivers the outcome of background work (a coroutine or a function) to the GUI thread"""
+    
+    finished = pyqtSignal(object, object)  # result, exception (None on success)
+
+
+def run_on_engine_loop(engine, coro, on_done, parent: QObject, timeout: float = None) -> CoroutineWatcher:
+    """
+    Schedule a coroutine on the engine's asyncio loop without blocking a thread.
+    
+    Args:
+        engine: Running SyncEngine whose loop runs the coroutine
+        coro: Coroutine to run
+        on_done: Called on the GUI thread as on_done(result, error)
+        parent: QObject that keeps the watcher alive until it fires
+        timeout: Optional timeout in seconds, applied inside the loop
+    """
+    watcher = CoroutineWatcher(parent)
+    watcher.finished.connect(on_done)
+    watcher.finished.connect(watcher.deleteLater)
+    
+    if timeout is not None:
+        coro = asyncio.wait_for(coro, timeout)
+    future = asyncio.run_coroutine_threadsafe(coro, engine.loop)
+    
+    def _deliver(done):
+        try:
+            watcher.finished.emit(done.result(), None)
+        except BaseException as e:
+            watcher.finished.emit(None, e)
+    
+    future.add_done_callback(_deliver)
+    return watcher
+
+
+def run_in_thread_pool(func, on_done, parent: QObject) -> CoroutineWatcher:
+    """
+    Run a blocking function on Qt's global thread pool.
+    
+    Args:
+        func: Callable taking no arguments; must not touch widgets
+        on_done: Called on the GUI thread as on_done(result, error)
+        parent: QObject that keeps the watcher alive until it fires
+    """
+    watcher = CoroutineWatcher(parent)
+    watcher.finished.connect(on_done)
+    watcher.finished.connect(watcher.deleteLater)
+    
+    def _run():
+        try:
+            result = func()
+        except Exception as e:
+            watcher.finished.emit(None, e)
+        else:
+            watcher.finished.emit(result, None)
+    
+    QThreadPool.globalInstance().start(_run)
+    return watcher
@@ -255,6 +255,177 @@ LIST_WIDGET = """
 """
 
 
+# Application-wide rules keyed by objectName. Set once on the QApplication
+# so Qt parses them a single time instead of once per widget instance.
+APP_QSS = """
+    QLabel#HeaderStatus {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QLabel#HeaderDeviceCount {
+        font-size: 14px;
+    }
+    
+    QWidget#Card, QWidget#Card QLabel {
+        background-color: white;
+        border-radius: 8px;
+        border: 1px solid #e0e0e0;
+    }
+    QLabel#StatIcon {
+        font-size: 28px;
+    }
+    QLabel#StatTitle {
+        color: #666;
+        font-size: 12px;
+    }
+    QLabel#StatValue {
+        font-size: 20px;
+        font-weight: bold;
+        color: #333;
+    }
+    QLabel#DeviceIcon {
+        font-size: 32px;
+    }
+    QLabel#DeviceName {
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QLabel#DeviceStatus {
+        color: #666;
+        font-size: 12px;
+    }
+    QLabel#DeviceTrust {
+        color: #4CAF50;
+        font-weight: bold;
+    }
+    QPushButton#DeviceConnect {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#DeviceConnect:hover {
+        background-color: #45a049;
+    }
+    QPushButton#DeviceConnect:pressed {
+        background-color: #3d8b40;
+    }
+    
+    QGroupBox#RecentActivity {
+        font-size: 14px;
+        font-weight: bold;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox#RecentActivity::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px;
+    }
+    QListView#ActivityList {
+        border: none;
+        background-color: #f9f9f9;
+    }
+    
+    QLineEdit#HistorySearch {
+        padding: 8px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    QComboBox#HistoryFilter {
+        padding: 8px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+    
+    QWidget#CloudStatusCard, QWidget#CloudStatusCard QLabel {
+        background-color: #FFF3E0;
+        border-radius: 6px;
+        margin-bottom: 10px;
+    }
+    QWidget#CloudStatusCard[connected="true"], QWidget#CloudStatusCard[connected="true"] QLabel {
+        background-color: #E8F5E9;
+    }
+    QLabel#CloudStatus {
+        font-weight: bold;
+        color: #E65100;
+    }
+    QLabel#CloudStatus[connected="true"] {
+        color: #2E7D32;
+    }
+    QLabel#CloudDetails {
+        color: #666;
+        font-size: 11px;
+    }
+    QLabel#CloudDevices {
+        color: #444;
+        font-size: 11px;
+        margin-top: 8px;
+    }
+    
+    QPushButton#DialogPrimary {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#DialogPrimary:hover {
+        background-color: #45a049;
+    }
+    QPushButton#DialogPrimary:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton#DialogSecondary {
+        padding: 8px 20px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+    QPushButton#DialogSecondary:hover {
+        background-color: #f0f0f0;
+    }
+    QDialog#CloudRelayDialog QPushButton#DialogPrimary,
+    QDialog#CloudRelayDialog QPushButton#DialogSecondary {
+        padding: 12px 30px;
+        border-radius: 6px;
+        font-size: 14px;
+    }
+    QDialog#CloudRelayDialog QLineEdit {
+        padding: 12px;
+        border: 2px solid #ddd;
+        border-radius: 6px;
+        font-size: 14px;
+    }
+    QDialog#CloudRelayDialog QLineEdit:focus {
+        border: 2px solid #4CAF50;
+    }
+    QLabel#CloudTip {
+        background-color: #E3F2FD;
+        color: #1976D2;
+        padding: 12px;
+        border-radius: 6px;
+        margin-top: 15px;
+    }
+    QTextEdit#PairingJson, QTextEdit#PairingInput {
+        border: 2px solid #4CAF50;
+        border-radius: 5px;
+        padding: 10px;
+        font-family: 'Courier New', monospace;
+        font-size: 11px;
+        background: #f9f9f9;
+    }
+    QTextEdit#PairingInput {
+        border-color: #2196F3;
+    }
+"""
+
+
 def get_btn_style(color: str, hover_color: str = None, text_color: str = 'white') -> str:
     """Generate a button style with custom colors."""
     if hover_color is None:
@@ -4,75 +4,13 @@
 Reusable widgets for Clipboard Sync Tool GUI.
 """
 
-from datetime import datetime
 from PyQt6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QMessageBox
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton
 )
 from PyQt6.QtCore import pyqtSignal
-import pyperclip
 
 from gui import styles
-from gui.styles import Colors, CONTENT_ICONS, PLATFORM_ICONS
-
-
-class ClipboardItemWidget(QWidget):
-    """Widget for displaying clipboard history item"""
-    
-    def __init__(self, content: str, content_type: str, timestamp: datetime, 
-                 device: str, is_sent: bool = True):
-        super().__init__()
-        self.content = content
-        self._setup_ui(content_type, timestamp, device, is_sent)
-    
-    def _setup_ui(self, content_type: str, timestamp: datetime, device: str, is_sent: bool):
-        layout = QHBoxLayout()
-        layout.setContentsMargins(10, 5, 10, 5)
-        
-        # Icon based on content type
-        icon_label = QLabel(CONTENT_ICONS.get(content_type, CONTENT_ICONS['default']))
-        icon_label.setStyleSheet("font-size: 24px;")
-        icon_label.setFixedWidth(40)
-        layout.addWidget(icon_label)
-        
-        # Content preview
-        content_layout = QVBoxLayout()
-        
-        # Content text (truncated)
-        display_text = str(self.content)
-        if len(display_text) > 100:
-            display_text = display_text[:100] + '...'
-        content_label = QLabel(display_text.replace('\n', ' '))
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet("font-size: 12px;")
-        content_layout.addWidget(content_label)
-        
-        # Metadata
-        direction = 'Sent to' if is_sent else 'From'
-        meta_text = f"{direction} {device} • {timestamp.strftime('%H:%M:%S')}"
-        meta_label = QLabel(meta_text)
-        meta_label.setStyleSheet(f"color: {Colors.TEXT_MUTED}; font-size: 10px;")
-        content_layout.addWidget(meta_label)
-        
-        layout.addLayout(content_layout, 1)
-        
-        # Copy button
-        copy_btn = QPushButton("Copy")
-        copy_btn.setToolTip("Copy to clipboard")
-        copy_btn.clicked.connect(self._copy_to_clipboard)
-        copy_btn.setFixedSize(60, 30)
-        copy_btn.setStyleSheet(styles.BTN_PRIMARY)
-        layout.addWidget(copy_btn)
-        
-        self.setLayout(layout)
-        self.setStyleSheet(styles.CARD_HOVER)
-
-    def _copy_to_clipboard(self):
-        """Copy content back to clipboard"""
-        try:
-            pyperclip.copy(str(self.content))
-            QMessageBox.information(self, "Copied", "Content copied to clipboard!")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not copy: {str(e)}")
+from gui.styles import Colors, PLATFORM_ICONS
 
 
 class DeviceWidget(QWidget):
@@ -84,6 +22,7 @@ class DeviceWidget(QWidget):
         super().__init__()
         self.device = device_info
         self.pair_btn = None  # Will be set if device not paired
+        self.device_ref = None  # Backing Device object, set by the owner
         self._setup_ui()
     
     def _setup_ui(self):
@@ -94,39 +33,58 @@ class DeviceWidget(QWidget):
         platform = self.device.get('platform', 'windows')
         icon = PLATFORM_ICONS.get(platform, PLATFORM_ICONS['default'])
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 32px;")
+        icon_label.setObjectName("DeviceIcon")
         icon_label.setFixedWidth(50)
         layout.addWidget(icon_label)
         
         # Device info
         info_layout = QVBoxLayout()
         
-        name_label = QLabel(self.device.get('name', 'Unknown Device'))
-        name_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-        info_layout.addWidget(name_label)
+        self.name_label = QLabel(self.device.get('name', 'Unknown Device'))
+        self.name_label.setObjectName("DeviceName")
+        info_layout.addWidget(self.name_label)
         
         status = self.device.get('status', 'unknown')
-        ip = self.device.get('ip_address', 'N/A')
-        status_icon = '🟢' if status in ('online', 'paired', 'discovered') else '🔴'
-        status_text = f"{status_icon} {status} • {ip}"
-        status_label = QLabel(status_text)
-        status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 12px;")
-        info_layout.addWidget(status_label)
+        self.status_label = QLabel(self._status_text(self.device))
+        self.status_label.setObjectName("DeviceStatus")
+        info_layout.addWidget(self.status_label)
         
         layout.addLayout(info_layout, 1)
         
         # Action button
         if status != 'paired':
             self.pair_btn = QPushButton("Connect")
-            self.pair_btn.setStyleSheet(styles.BTN_PRIMARY)
+            self.pair_btn.setObjectName("DeviceConnect")
             layout.addWidget(self.pair_btn)
         else:
             trust_label = QLabel("✔ Connected")
-            trust_label.setStyleSheet(f"color: {Colors.SUCCESS}; font-weight: bold;")
+            trust_label.setObjectName("DeviceTrust")
             layout.addWidget(trust_label)
         
         self.setLayout(layout)
-        self.setStyleSheet(styles.CARD)
+        self.setObjectName("Card")  # Styled by styles.APP_QSS
+    
+    @staticmethod
+    def _status_text(device_info: dict) -> str:
+        status = device_info.get('status', 'unknown')
+        ip = device_info.get('ip_address', 'N/A')
+        status_icon = '🟢' if status in ('online', 'paired', 'discovered') else '🔴'
+        return f"{status_icon} {status} • {ip}"
+    
+    def update_state(self, device_info: dict):
+        """Update name and status in place, touching only labels that changed"""
+        if device_info == self.device:
+            return
+        
+        name = device_info.get('name', 'Unknown Device')
+        if name != self.name_label.text():
+            self.name_label.setText(name)
+        
+        status_text = self._status_text(device_info)
+        if status_text != self.status_label.text():
+            self.status_label.setText(status_text)
+        
+        self.device = device_info
 
 
 class StatCard(QWidget):
@@ -53,6 +53,8 @@ def setup_logging(debug: bool = False):
 
 def check_dependencies():
     """Check if required dependencies are installed"""
+    import importlib.util
+    
     missing = []
     
     required_packages = {
@@ -65,12 +67,13 @@ def check_dependencies():
         'loguru': 'loguru'
     }
     
+    # Locate modules without importing them; heavy ones load on first use
     for module, package in required_packages.items():
         try:
             if module == 'PyQt6':
                 from PyQt6.QtWidgets import QApplication
-            else:
-                __import__(module)
+            elif importlib.util.find_spec(module) is None:
+                missing.append(package)
         except ImportError:
             missing.append(package)
     
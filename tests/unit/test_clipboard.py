@@ -79,6 +79,11 @@ class TestCoreModules:
         from core.cloud_relay_client import CloudRelayClient
         assert CloudRelayClient is not None
     
+    def test_clipboard_module(self):
+        """Test clipboard write module imports"""
+        from core.clipboard import set_text
+        assert callable(set_text)
+    
     def test_cloud_relay_crypto_module(self):
         """Test cloud relay crypto module imports"""
         from core.cloud_relay_crypto import CloudRelayCrypto
@@ -114,6 +119,16 @@ class TestClipboardMonitor:
         assert isinstance(history, list)
         assert len(history) == 0
     
+    def test_checksum_matches_for_text_and_bytes(self):
+        """Test text and its UTF-8 bytes produce the same checksum"""
+        from core.monitor import ClipboardMonitor, calculate_checksum
+        
+        monitor = ClipboardMonitor(device_id="test-device")
+        text = "Hello 世界"
+        
+        assert calculate_checksum(text) == calculate_checksum(text.encode('utf-8'))
+        assert monitor._calculate_checksum(text) == calculate_checksum(text)
+    
     def test_clear_history(self):
         """Test clearing monitor history"""
         from core.monitor import ClipboardMonitor
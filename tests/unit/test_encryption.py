@@ -96,6 +96,76 @@ class TestHybridEncryption:
         assert signature is not None
         assert isinstance(signature, str)
         assert len(signature) > 0
+    
+    def test_encrypt_wraps_key_per_peer(self):
+        """Test content is encrypted once and the key wrapped for every peer"""
+        from core.encryption import HybridEncryption
+        
+        sender = HybridEncryption()
+        sender.device_id = 'sender'
+        peers = [HybridEncryption() for _ in range(3)]
+        for i, peer in enumerate(peers):
+            peer.device_id = f"peer-{i}"
+            sender.import_peer_key(peer.device_id, peer.export_public_key())
+            peer.import_peer_key('sender', sender.export_public_key())
+        
+        # Two messages, so the second reuses each peer's cached shared key
+        for payload in (b"shared payload", b"second payload"):
+            encrypted = sender.encrypt_content(payload, 'text')
+            
+            assert set(encrypted['encrypted_keys']) == {'peer-0', 'peer-1', 'peer-2'}
+            assert isinstance(encrypted['encrypted_content'], str)
+            for peer in peers:
+                assert peer.decrypt_content(encrypted) == (payload, 'text')
+    
+    def test_binary_envelope_roundtrip(self):
+        """Test binary envelopes carry raw bytes and decrypt like base64 ones"""
+        from core.encryption import HybridEncryption
+        
+        sender = HybridEncryption()
+        receiver = HybridEncryption()
+        receiver.device_id = 'receiver'
+        sender.import_peer_key('receiver', receiver.export_public_key())
+        receiver.import_peer_key(sender.device_id, sender.export_public_key())
+        
+        encrypted = sender.encrypt_content(b"binary payload" * 100, 'text', binary=True)
+        
+        assert isinstance(encrypted['encrypted_content'], bytes)
+        assert isinstance(encrypted['encrypted_keys']['receiver'], bytes)
+        assert encrypted['format'] == 'binary'
+        
+        content, content_type = receiver.decrypt_content(encrypted)
+        assert content == b"binary payload" * 100
+        assert content_type == 'text'
+        
+        # The default envelope stays base64 for older peers and decrypts the same way
+        legacy = sender.encrypt_content(b"legacy payload", 'text')
+        assert legacy['format'] == 'base64'
+        assert isinstance(legacy['encrypted_content'], str)
+        assert receiver.decrypt_content(legacy) == (b"legacy payload", 'text')
+    
+    def test_reimported_peer_key_rederives_shared_key(self):
+        """Test importing a new key for a peer drops its cached shared key"""
+        from core.encryption import HybridEncryption
+        from cryptography.exceptions import InvalidTag
+        
+        sender = HybridEncryption()
+        sender.device_id = 'sender'
+        old_device, new_device = HybridEncryption(), HybridEncryption()
+        for device in (old_device, new_device):
+            device.device_id = 'peer'
+            device.import_peer_key('sender', sender.export_public_key())
+        
+        sender.import_peer_key('peer', old_device.export_public_key())
+        assert old_device.decrypt_content(sender.encrypt_content(b"before", 'text'))[0] == b"before"
+        
+        # The peer re-paired with a new keypair; only the new key can read what follows
+        sender.import_peer_key('peer', new_device.export_public_key())
+        encrypted = sender.encrypt_content(b"after", 'text')
+        
+        assert new_device.decrypt_content(encrypted)[0] == b"after"
+        with pytest.raises(InvalidTag):
+            old_device.decrypt_content(encrypted)
 
 
 class TestCloudRelayCrypto:
@@ -0,0 +1,115 @@
+# tests/unit/test_history.py
+"""
+Unit tests for the GUI history search index.
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+
+class TestHistorySearchIndex:
+    """Test HistorySearchIndex class"""
+    
+    @pytest.fixture
+    def index(self):
+        from gui.history import HistorySearchIndex
+        
+        index = HistorySearchIndex()
+        index.add(0, "Hello World", 'text')
+        index.add(1, "https://example.com/hello", 'url')
+        index.add(2, "def hello(): pass", 'code')
+        return index
+    
+    def test_search_is_case_insensitive_substring(self, index):
+        """Test search matches substrings regardless of case"""
+        assert index.search("HELLO") == {0, 1, 2}
+        assert index.search("lo wo") == {0}
+        assert index.search("missing") == set()
+    
+    def test_search_short_query_and_kind(self, index):
+        """Test queries shorter than a trigram and kind filtering"""
+        assert index.search("he") == {0, 1, 2}
+        assert index.search("", 'url') == {1}
+        assert index.search("hello", 'code') == {2}
+    
+    def test_remove_and_long_text(self, index):
+        """Test removed items stop matching and long text is still found"""
+        from gui.history import MAX_INDEXED_CHARS
+        
+        index.remove(0)
+        index.add(3, "x" * MAX_INDEXED_CHARS + " needle", 'text')
+        
+        assert index.search("hello") == {1, 2}
+        assert index.search("needle") == {3}
+        assert len(index) == 3
+    
+    def test_classify_content(self):
+        """Test the url/code/text heuristic used by the filter"""
+        from gui.history import classify_content
+        
+        assert classify_content("https://example.com") == 'url'
+        assert classify_content("import os") == 'code'
+        assert classify_content("just words") == 'text'
+        assert classify_content("x = 1\nCLASS Foo: pass") == 'code'
+    
+    def test_classify_content_scans_only_the_head(self):
+        """Test keywords past the scan window do not make an item code"""
+        from gui.history import CLASSIFY_SCAN_CHARS, classify_content
+        
+        assert classify_content("a" * CLASSIFY_SCAN_CHARS + " import os") == 'text'
+
+
+class TestHistoryModel:
+    """Test HistoryModel row bookkeeping"""
+    
+    def test_prepend_trim_and_row_for_id(self):
+        """Test newest rows stay on top and ids map to rows after trimming"""
+        from datetime import datetime
+        from gui.history import HistoryModel, make_history_row
+        
+        model = HistoryModel()
+        for item_id in range(5):
+            model.prepend(make_history_row(item_id, f"item {item_id}", 'text',
+                                           datetime.now(), 'Local', True))
+        
+        removed = model.remove_oldest(2)
+        
+        assert [row['id'] for row in removed] == [1, 0]
+        assert model.rowCount() == 3
+        assert model.index(0).data() == "item 4"
+        assert model.row_for_id(2) == 2
+        assert model.row_for_id(0) == -1
+    
+    def test_binary_row_copies_original_bytes(self):
+        """Test a binary row keeps its bytes and copies them instead of its description"""
+        from datetime import datetime
+        from PyQt6.QtCore import QBuffer, QIODevice
+        from PyQt6.QtGui import QImage
+        from gui.history import DATA_ROLE, HistoryModel, history_mime_data, make_history_row
+        
+        image = QImage(4, 3, QImage.Format.Format_RGB32)
+        image.fill(0xff0000)
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, 'PNG')
+        png = bytes(buffer.data())
+        
+        model = HistoryModel()
+        model.prepend(make_history_row(0, "[Image 4×3, 0 KB]", 'image',
+                                       datetime.now(), 'Local', True, data=png))
+        index = model.index(0)
+        
+        assert index.data() == "[Image 4×3, 0 KB]"
+        assert index.data(DATA_ROLE) == png
+        
+        mime = history_mime_data(index.data(), index.data(DATA_ROLE))
+        assert mime.hasImage() and not mime.hasText()
+        assert mime.imageData().size() == image.size()
+        
+        other = history_mime_data("[File 0 KB]", b"\x00\x01")
+        assert bytes(other.data('application/octet-stream')) == b"\x00\x01"
+        assert history_mime_data("hello").text() == "hello"
@@ -0,0 +1,42 @@
+# tests/unit/test_main_window.py
+"""
+Unit tests for the main window's shutdown path.
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+
+class TestShutdownWatchdog:
+    """Test the forced exit used when a backend hangs on quit"""
+    
+    def test_force_exit_flushes_and_closes_log_sinks(self, tmp_path):
+        """Test queued log records reach the file and sinks are closed before os._exit"""
+        from unittest.mock import patch
+        from loguru import logger
+        from gui.main_window import MainWindow
+        
+        log_file = tmp_path / "app.log"
+        logger.add(str(log_file), enqueue=True, format="{message}")
+        seen = {}
+        
+        def fake_exit(code):
+            logger.info("after exit")
+            seen['code'] = code
+            seen['log'] = log_file.read_text()
+        
+        try:
+            logger.info("last words")
+            with patch('gui.main_window.os._exit', side_effect=fake_exit):
+                MainWindow._force_exit()
+        finally:
+            logger.remove()
+            logger.add(sys.stderr)
+        
+        assert seen['code'] == 0
+        assert "last words" in seen['log']
+        assert "after exit" not in seen['log']
@@ -69,6 +69,65 @@ class TestSyncEngine:
         
         assert isinstance(devices, list)
         assert len(devices) == 0
+    
+    def test_history_records_clipboard_content(self):
+        """Test sent clipboard content is recorded with its type value"""
+        from core.sync_engine import SyncEngine
+        from core.monitor import ClipboardContent, ContentType
+        from datetime import datetime
+        
+        engine = SyncEngine()
+        engine._add_to_history('sent', ClipboardContent(
+            content='hello',
+            content_type=ContentType.TEXT,
+            timestamp=datetime.now(),
+            device_id='dev-1',
+            checksum='abc',
+            metadata={}
+        ))
+        
+        entry = engine.get_sync_history(1)[0]
+        assert entry['action'] == 'sent'
+        assert entry['data'] == {'content_type': 'text', 'device': 'dev-1'}
+    
+    def test_cloud_item_listener_gets_typed_item(self):
+        """Test cloud relay items reach the listener as CloudRelayItem"""
+        from unittest.mock import patch
+        from core.sync_engine import SyncEngine, CloudRelayItem
+        
+        engine = SyncEngine()
+        received = []
+        engine.on_cloud_item_received = received.append
+        
+        with patch('core.sync_engine.clipboard.set_text'):
+            engine._on_cloud_clipboard_received('from phone', 'text')
+        
+        assert len(received) == 1
+        item = received[0]
+        assert isinstance(item, CloudRelayItem)
+        assert (item.content, item.content_type, item.device) == ('from phone', 'text', 'Cloud Relay')
+        assert engine.get_sync_history(1)[0]['data']['source'] == 'cloud_relay'
+    
+    def test_state_listeners_fire_on_changes(self):
+        """Test device and cloud relay listeners are called on state edges"""
+        from core.sync_engine import SyncEngine
+        from datetime import datetime
+        from core.network import Device, DeviceStatus
+        
+        engine = SyncEngine()
+        events = []
+        engine.on_devices_changed = lambda: events.append('devices')
+        engine.on_cloud_relay_changed = lambda: events.append('cloud')
+        
+        device = Device('dev-1', 'Laptop', '10.0.0.2', 5000, DeviceStatus.PAIRED, datetime.now())
+        engine.paired_devices[device.device_id] = device
+        engine._on_device_lost(device)
+        engine._on_devices_updated([{'deviceId': 'phone', 'deviceName': 'Phone'}])
+        engine._on_cloud_connection_changed(False)
+        
+        assert events == ['devices', 'cloud', 'cloud']
+        assert engine.paired_devices == {}
+        assert engine.cloud_devices == []
 
 
 class TestSyncSettings:
@@ -107,6 +166,17 @@ class TestSyncSettings:
         settings = SyncSettings()
         assert 'password_manager' in settings.excluded_apps
         assert 'banking_app' in settings.excluded_apps
+    
+    def test_list_defaults_not_shared(self):
+        """Test each settings instance gets its own default lists"""
+        from core.sync_engine import SyncSettings
+        
+        first = SyncSettings()
+        second = SyncSettings()
+        first.trusted_networks.append('home')
+        
+        assert second.trusted_networks == []
+        assert first.excluded_apps is not second.excluded_apps
 
 
 class TestQRPairing:
@@ -142,3 +212,114 @@ class TestQRPairing:
         
         assert data['device_name'] == "My Computer"
         assert data['device_id'] == engine.device_id
+
+
+class TestEnvelopeNegotiation:
+    """Test binary P2P envelopes are only used with peers that support them"""
+    
+    def test_binary_only_when_every_peer_advertised_it(self):
+        """Test a peer paired without the flag makes the engine fall back to base64"""
+        from core.sync_engine import SyncEngine
+        from core.encryption import HybridEncryption
+        from core.monitor import ClipboardContent, ContentType
+        from core.network import Device, DeviceStatus
+        from unittest.mock import AsyncMock
+        from datetime import datetime
+        import asyncio
+        
+        engine = SyncEngine()
+        engine.p2p.sio_server.emit = AsyncMock()
+        pair_request = engine.p2p.sio_server.handlers['/']['pair_request']
+        sent = []
+        engine._queue_broadcast = sent.append
+        
+        def pair(peer, **flags):
+            asyncio.run(pair_request('sid', {
+                'device_id': peer.device_id,
+                'public_key': peer.export_public_key(),
+                **flags
+            }))
+            peer.import_peer_key(engine.device_id, engine.encryption.export_public_key())
+            engine.paired_devices[peer.device_id] = Device(
+                peer.device_id, 'Peer', '10.0.0.2', 5000, DeviceStatus.PAIRED, datetime.now()
+            )
+        
+        def copy(text):
+            engine._on_clipboard_change(ClipboardContent(
+                content=text, content_type=ContentType.TEXT, timestamp=datetime.now(),
+                device_id=engine.device_id, checksum=text, metadata={}
+            ))
+            return sent[-1]
+        
+        # Instances in one process share a host/pid based id, so name the peers
+        new_peer, old_peer = HybridEncryption(), HybridEncryption()
+        new_peer.device_id, old_peer.device_id = 'new-peer', 'old-peer'
+        pair(new_peer, binary_envelopes=True)
+        
+        # Our pair_response advertises the capability back
+        assert engine.p2p.sio_server.emit.call_args[0][1]['binary_envelopes'] is True
+        
+        envelope = copy("to new peer")
+        assert envelope['format'] == 'binary'
+        assert new_peer.decrypt_content(envelope)[0] == b"to new peer"
+        
+        # One peer without the flag means every peer gets base64
+        pair(old_peer)
+        envelope = copy("to both peers")
+        assert envelope['format'] == 'base64'
+        assert isinstance(envelope['encrypted_content'], str)
+        for peer in (new_peer, old_peer):
+            assert peer.decrypt_content(envelope)[0] == b"to both peers"
+
+
+class TestBroadcastCoalescing:
+    """Test micro-batching of outgoing P2P broadcasts"""
+    
+    def test_burst_sends_only_latest(self):
+        """Test a burst of changes within the window is sent once"""
+        from core.sync_engine import SyncEngine
+        from unittest.mock import AsyncMock
+        import asyncio
+        
+        engine = SyncEngine()
+        engine.p2p.broadcast_clipboard = AsyncMock()
+        engine.loop = asyncio.new_event_loop()
+        
+        try:
+            for i in range(5):
+                engine._queue_broadcast({'n': i})
+            engine.loop.run_until_complete(asyncio.sleep(engine.BROADCAST_BATCH_WINDOW * 5))
+            
+            engine.p2p.broadcast_clipboard.assert_awaited_once_with({'n': 4})
+            
+            # A change after the flush starts a new batch
+            engine._queue_broadcast({'n': 5})
+            engine.loop.run_until_complete(asyncio.sleep(engine.BROADCAST_BATCH_WINDOW * 5))
+            
+            assert engine.p2p.broadcast_clipboard.await_count == 2
+            engine.p2p.broadcast_clipboard.assert_awaited_with({'n': 5})
+        finally:
+            engine.loop.close()
+    
+    def test_failed_broadcast_is_logged(self):
+        """Test a failing send is logged and later changes are still sent"""
+        from core.sync_engine import SyncEngine
+        from unittest.mock import AsyncMock, patch
+        import asyncio
+        
+        engine = SyncEngine()
+        engine.p2p.broadcast_clipboard = AsyncMock(side_effect=[ConnectionError("peer gone"), None])
+        engine.loop = asyncio.new_event_loop()
+        
+        try:
+            with patch('core.sync_engine.logger') as logger:
+                engine._queue_broadcast({'n': 1})
+                engine.loop.run_until_complete(asyncio.sleep(engine.BROADCAST_BATCH_WINDOW * 5))
+                engine._queue_broadcast({'n': 2})
+                engine.loop.run_until_complete(asyncio.sleep(engine.BROADCAST_BATCH_WINDOW * 5))
+            
+            assert "peer gone" in logger.error.call_args[0][0]
+            engine.p2p.broadcast_clipboard.assert_awaited_with({'n': 2})
+            assert engine.p2p.broadcast_clipboard.await_count == 2
+        finally:
+            engine.loop.close()